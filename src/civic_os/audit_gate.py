@@ -1,3 +1,4 @@
+"""
 CIVIC-OS Audit Gate
 Truth • Logic • Risk • Bias • Clarity  => PASS/FAIL
 
@@ -15,37 +16,56 @@ Usage:
 
 from __future__ import annotations
 
+import json
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 Verdict = str  # "PASS" or "FAIL"
 
 
+def _canonical_json_bytes(obj: Any) -> bytes:
+    """Canonical form (sorted keys, tight separators) as UTF-8 bytes; matches
+    the form SignedMemory uses for payloads."""
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
 # -----------------------------
 # Data models
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class GateResult:
+    """
+    Result of a single gate. Treated as immutable after evaluate() returns;
+    to_dict() caches its output under that invariant.
+    """
     gate: str
     verdict: Verdict
     notes: List[str] = field(default_factory=list)
     fixes: List[str] = field(default_factory=list)
     score: float = 0.0  # 0..1 heuristic
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "gate": self.gate,
-            "verdict": self.verdict,
-            "score": round(self.score, 3),
-            "notes": self.notes,
-            "fixes": self.fixes,
-        }
-
-
-@dataclass
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "gate": self.gate,
+                "verdict": self.verdict,
+                "score": round(self.score, 3),
+                "notes": self.notes,
+                "fixes": self.fixes,
+            }
+        return self._dict_cache
+
+
+@dataclass(slots=True)
 class AuditReport:
+    """
+    Full audit report. Treated as immutable after evaluate() returns;
+    to_dict() caches its output so repeat serialization (HTTP body, log
+    payload, metric sink) pays the dict construction only once.
+    """
     codex_id: str
     timestamp_utc: str
     overall_verdict: Verdict
@@ -53,20 +73,31 @@ class AuditReport:
     summary: str
     minimum_fixes: List[str]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _bytes_cache: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "codex_id": self.codex_id,
-            "timestamp_utc": self.timestamp_utc,
-            "overall_verdict": self.overall_verdict,
-            "summary": self.summary,
-            "minimum_fixes": self.minimum_fixes,
-            "gate_results": [gr.to_dict() for gr in self.gate_results],
-            "metadata": self.metadata,
-        }
-
-
-@dataclass
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "codex_id": self.codex_id,
+                "timestamp_utc": self.timestamp_utc,
+                "overall_verdict": self.overall_verdict,
+                "summary": self.summary,
+                "minimum_fixes": self.minimum_fixes,
+                "gate_results": [gr.to_dict() for gr in self.gate_results],
+                "metadata": self.metadata,
+            }
+        return self._dict_cache
+
+    def to_canonical_bytes(self) -> bytes:
+        """Canonical JSON bytes of to_dict(), cached; reusable as a signed-log
+        payload without re-serializing."""
+        if self._bytes_cache is None:
+            self._bytes_cache = _canonical_json_bytes(self.to_dict())
+        return self._bytes_cache
+
+
+@dataclass(slots=True)
 class AuditContext:
     """
     A minimal, tool-agnostic context for auditing a decision/process change.
@@ -86,7 +117,13 @@ class AuditContext:
 # Helpers
 # -----------------------------
 def _now_utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # time.gmtime + f-string is several times cheaper than constructing a
+    # datetime and calling isoformat(); second precision is enough for reports.
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}+00:00"
+    )
 
 
 def _is_nonempty_str(x: Any) -> bool:
@@ -110,29 +147,389 @@ def _get(d: Dict[str, Any], *path: str, default=None):
     return cur
 
 
-def _has_any_textual_evidence(es: Dict[str, Any]) -> bool:
-    facts = _as_list(es.get("Facts") or es.get("facts"))
-    # Allow either explicit sources or at least fact statements
-    if len([f for f in facts if _is_nonempty_str(f) or isinstance(f, dict)]) > 0:
-        return True
-    sources = _as_list(es.get("Sources") or es.get("sources"))
-    if len([s for s in sources if _is_nonempty_str(s) or isinstance(s, dict)]) > 0:
+def _is_empty(v: Any) -> bool:
+    # Single type() dispatch instead of an isinstance chain; exact types are
+    # fine here because artifacts are plain JSON-ish str/list/dict values.
+    if v is None:
         return True
+    t = type(v)
+    if t is str:
+        return not v.strip()
+    if t is list or t is dict:
+        return not v
     return False
 
 
 def _count_missing_required(required: List[Tuple[str, Any]]) -> List[str]:
-    missing = []
-    for name, val in required:
-        if val is None:
-            missing.append(name)
-        elif isinstance(val, str) and val.strip() == "":
-            missing.append(name)
-        elif isinstance(val, list) and len(val) == 0:
-            missing.append(name)
-        elif isinstance(val, dict) and len(val) == 0:
-            missing.append(name)
-    return missing
+    return [name for name, val in required if _is_empty(val)]
+
+
+# -----------------------------
+# Alias tables
+# -----------------------------
+# Known spellings per artifact field, resolved by _first_present in one pass.
+# Module-level tuples keep the key strings interned and shared across calls.
+_FACT_KEYS = ("Facts", "facts")
+_SOURCE_KEYS = ("Sources", "sources")
+_ASSUMPTION_KEYS = ("Assumptions", "assumptions")
+_UNKNOWN_KEYS = ("Unknowns", "unknowns")
+_DATA_RISK_KEYS = ("Data risks", "DataRisks", "data_risks")
+_FALSIFIER_KEYS = ("Falsifiers", "falsifiers")
+_MINIMAL_TEST_KEYS = ("Minimal tests", "MinimalTests", "minimal_tests")
+_LEVER_KEYS = ("Levers", "levers")
+_VARIABLE_KEYS = ("Variables", "variables")
+_CAUSAL_KEYS = ("Causal structure", "causal_structure", "CausalStructure")
+_LOOP_KEYS = ("Loops", "loops")
+_DELAY_KEYS = ("Delays", "delays")
+_BOTTLENECK_KEYS = ("Bottlenecks", "bottlenecks")
+_OPTION_A_KEYS = ("Option A", "OptionA")
+_OPTION_B_KEYS = ("Option B", "OptionB")
+_OPTION_C_KEYS = ("Option C", "OptionC")
+_DOWNSIDE_KEYS = ("Global downside bound", "GlobalDownsideBound", "DownsideBound")
+_DS_ROLLBACK_KEYS = ("Rollback plan", "Rollback")
+_AP_ROLLBACK_KEYS = ("Rollback", "rollback")
+_KILL_SWITCH_KEYS = ("Kill-switch", "KillSwitch")
+_STAGE_KEYS = ("Stages", "stages", "Steps", "steps")
+_THRESHOLD_KEYS = ("Thresholds", "thresholds", "Metrics & thresholds", "metrics_thresholds")
+_INSTRUMENTATION_KEYS = ("Instrumentation", "instrumentation")
+_CHECKLIST_KEYS = ("Execution checklist", "checklist", "Checklist")
+_ACTOR_KEYS = ("Actors & incentives", "Actors", "actors")
+_INCENTIVE_KEYS = ("Incentives", "incentives")
+_CORRUPTION_KEYS = ("Corruption surfaces", "corruption_surfaces")
+_HIDDEN_COST_KEYS = ("Hidden costs/externalities", "hidden_costs")
+_GOAL_KEYS = ("Goal", "goal")
+_DELIVERABLE_KEYS = ("Deliverable", "deliverable")
+_SUCCESS_METRIC_KEYS = ("Success metrics", "success_metrics")
+_CITIZEN_SUMMARY_KEYS = ("Citizen summary", "citizen_summary")
+
+
+def _first_present(d: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """
+    Returns the first truthy value among the aliased keys; when none is
+    truthy, returns the last alias's value (possibly a falsy non-None one).
+    This mirrors the chained `d.get(a) or d.get(b)` expression it replaced:
+    a present-but-falsy value (e.g. "" or {}) still counts as present for
+    the gates, which matters for verdicts on near-passing artifacts.
+    """
+    v = None
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return v
+
+
+def _specialize_accessor(keys: Tuple[str, ...]):
+    """
+    Compiles a dedicated accessor for an alias tuple, with the lookups
+    inlined as straight-line code (no per-call loop over the keys).
+
+    Used for the longer alias chains; generated once at import time.
+    """
+    lines = ["def _acc(d):"]
+    for k in keys[:-1]:
+        lines.append(f"    v = d.get({k!r})")
+        lines.append("    if v:")
+        lines.append("        return v")
+    # Same falsy-fallthrough semantics as _first_present: the last alias's
+    # value is returned even when falsy.
+    lines.append(f"    return d.get({keys[-1]!r})")
+    ns: Dict[str, Any] = {}
+    exec(compile("\n".join(lines), f"<accessor {keys[0]}>", "exec"), ns)
+    return ns["_acc"]
+
+
+# Specialized accessors for the 3+ key alias chains (risk/clarity hot path).
+_get_data_risks = _specialize_accessor(_DATA_RISK_KEYS)
+_get_minimal_tests = _specialize_accessor(_MINIMAL_TEST_KEYS)
+_get_causal = _specialize_accessor(_CAUSAL_KEYS)
+_get_downside = _specialize_accessor(_DOWNSIDE_KEYS)
+_get_stages = _specialize_accessor(_STAGE_KEYS)
+_get_thresholds = _specialize_accessor(_THRESHOLD_KEYS)
+_get_checklist = _specialize_accessor(_CHECKLIST_KEYS)
+_get_actors = _specialize_accessor(_ACTOR_KEYS)
+
+
+# -----------------------------
+# Normalized artifact view
+# -----------------------------
+@dataclass(slots=True)
+class _NormView:
+    """
+    A flat, alias-resolved view of the artifacts dict.
+
+    Each alias chain (e.g. "Facts" vs "facts") is resolved exactly once here,
+    so the five gates can read plain lists/values instead of re-walking the
+    raw dicts per gate.
+    """
+    # ES
+    facts: List[Any]
+    assumptions: List[Any]
+    unknowns: List[Any]
+    data_risks: List[Any]
+    has_evidence: bool
+    # FPF
+    falsifiers: List[Any]
+    minimal_tests: List[Any]
+    levers: List[Any]
+    variables: List[Any]
+    # WM
+    causal: Any
+    loops: List[Any]
+    delays: List[Any]
+    bottlenecks: List[Any]
+    # DS
+    has_options: bool
+    # The narrative-drift heuristics (Truth/Bias) key on the baseline's
+    # narrower "Option A or explicit options list" test, not on any option
+    # slot being filled; has_options stays the broad form for the Logic gate.
+    has_option_a_or_list: bool
+    options_count: int
+    downside: Any
+    rollback: Any
+    kill_switch: Any
+    # AP
+    stages: List[Any]
+    thresholds: Any
+    instrumentation: Any
+    checklist: Any
+    # SM
+    actors: List[Any]
+    incentives: List[Any]
+    corruption: List[Any]
+    hidden_costs: List[Any]
+    # IC
+    goal: Any
+    deliverable: Any
+    success_metrics: Any
+    citizen_summary: Any
+
+
+def _normalize(artifacts: Dict[str, Any]) -> _NormView:
+    """
+    Resolves every known alias chain exactly once and returns a _NormView.
+    """
+    ic = artifacts.get("IC") or {}
+    es = artifacts.get("ES") or {}
+    fpf = artifacts.get("FPF") or {}
+    wm = artifacts.get("WM") or {}
+    sm = artifacts.get("SM") or {}
+    ds = artifacts.get("DS") or {}
+    ap = artifacts.get("AP") or {}
+
+    facts = _as_list(_first_present(es, _FACT_KEYS))
+    sources = _as_list(_first_present(es, _SOURCE_KEYS))
+
+    # Evidence presence heuristic: explicit sources or at least fact statements
+    has_evidence = (
+        len([f for f in facts if _is_nonempty_str(f) or isinstance(f, dict)]) > 0
+        or len([s for s in sources if _is_nonempty_str(s) or isinstance(s, dict)]) > 0
+    )
+
+    # DS options: named slots or an explicit list
+    opt_a = _first_present(ds, _OPTION_A_KEYS)
+    opt_b = _first_present(ds, _OPTION_B_KEYS)
+    opt_c = _first_present(ds, _OPTION_C_KEYS)
+    options_list = ds.get("options")
+    options_count = (1 if opt_a else 0) + (1 if opt_b else 0) + (1 if opt_c else 0)
+    if isinstance(options_list, list):
+        options_count = max(options_count, len(options_list))
+
+    return _NormView(
+        facts=facts,
+        assumptions=_as_list(_first_present(es, _ASSUMPTION_KEYS)),
+        unknowns=_as_list(_first_present(es, _UNKNOWN_KEYS)),
+        data_risks=_as_list(_get_data_risks(es)),
+        has_evidence=has_evidence,
+        falsifiers=_as_list(_first_present(fpf, _FALSIFIER_KEYS)),
+        minimal_tests=_as_list(_get_minimal_tests(fpf)),
+        levers=_as_list(_first_present(fpf, _LEVER_KEYS)),
+        variables=_as_list(_first_present(fpf, _VARIABLE_KEYS)),
+        causal=_get_causal(wm),
+        loops=_as_list(_first_present(wm, _LOOP_KEYS)),
+        delays=_as_list(_first_present(wm, _DELAY_KEYS)),
+        bottlenecks=_as_list(_first_present(wm, _BOTTLENECK_KEYS)),
+        has_options=bool(opt_a or opt_b or opt_c or options_list),
+        has_option_a_or_list=bool(opt_a or options_list),
+        options_count=options_count,
+        downside=_get_downside(ds),
+        rollback=_first_present(ds, _DS_ROLLBACK_KEYS) or _first_present(ap, _AP_ROLLBACK_KEYS),
+        kill_switch=_first_present(ds, _KILL_SWITCH_KEYS) or _first_present(ap, _KILL_SWITCH_KEYS),
+        stages=_as_list(_get_stages(ap)),
+        thresholds=_get_thresholds(ap),
+        instrumentation=_first_present(ap, _INSTRUMENTATION_KEYS),
+        checklist=_get_checklist(ap),
+        actors=_as_list(_get_actors(sm)),
+        incentives=_as_list(_first_present(sm, _INCENTIVE_KEYS)),
+        corruption=_as_list(_first_present(sm, _CORRUPTION_KEYS)),
+        hidden_costs=_as_list(_first_present(sm, _HIDDEN_COST_KEYS)),
+        goal=_first_present(ic, _GOAL_KEYS),
+        deliverable=_first_present(ic, _DELIVERABLE_KEYS),
+        success_metrics=_first_present(ic, _SUCCESS_METRIC_KEYS),
+        citizen_summary=(
+            artifacts.get("CitizenSummary")
+            or _first_present(ic, _CITIZEN_SUMMARY_KEYS)
+            or _first_present(ap, _CITIZEN_SUMMARY_KEYS)
+        ),
+    )
+
+
+# -----------------------------
+# Gate specs
+# -----------------------------
+@dataclass(slots=True)
+class _GateSpec:
+    """
+    Declarative description of one audit gate: which _NormView fields are
+    required, the fix to suggest when they are missing, and an optional
+    extra-check hook holding the gate's irregular heuristics.
+
+    Extra checks take the normalized view and return
+    (notes, fixes, penalty, extra_fail).
+    """
+    name: str
+    required: Tuple[Tuple[str, Any], ...]  # (label, view attr name or callable(nv))
+    missing_fix: str
+    extra_check: Optional[Callable[[_NormView], Tuple[List[str], List[str], float, bool]]] = None
+
+
+def _truth_extra(nv: _NormView) -> Tuple[List[str], List[str], float, bool]:
+    notes: List[str] = []
+    fixes: List[str] = []
+
+    # Evidence presence heuristic
+    if not nv.has_evidence:
+        notes.append("Evidence looks weak: no sources or fact statements detected.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21\u0e2b\u0e25\u0e31\u0e01\u0e10\u0e32\u0e19: \u0e43\u0e2a\u0e48 Facts \u0e17\u0e35\u0e48\u0e15\u0e23\u0e27\u0e08\u0e2a\u0e2d\u0e1a\u0e44\u0e14\u0e49 + Sources (\u0e25\u0e34\u0e07\u0e01\u0e4c/\u0e40\u0e2d\u0e01\u0e2a\u0e32\u0e23/\u0e02\u0e49\u0e2d\u0e21\u0e39\u0e25\u0e15\u0e31\u0e27\u0e2d\u0e22\u0e48\u0e32\u0e07)")
+
+    # Claims sanity: if DS has options but ES empty => likely narrative
+    if nv.has_option_a_or_list and len(nv.facts) == 0:
+        notes.append("Decisions exist but no facts listed \u2014 risk of narrative-driven decision.")
+        fixes.append("\u0e01\u0e48\u0e2d\u0e19\u0e15\u0e31\u0e14\u0e2a\u0e34\u0e19\u0e43\u0e08: \u0e43\u0e2a\u0e48 Facts \u0e2d\u0e22\u0e48\u0e32\u0e07\u0e19\u0e49\u0e2d\u0e22 5 \u0e02\u0e49\u0e2d + \u0e23\u0e30\u0e1a\u0e38 Unknowns \u0e17\u0e35\u0e48\u0e2a\u0e33\u0e04\u0e31\u0e0d")
+
+    # Testability
+    if nv.falsifiers and len(nv.minimal_tests) == 0:
+        notes.append("Falsifiers exist but minimal tests not specified.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Minimal tests \u0e2d\u0e22\u0e48\u0e32\u0e07\u0e19\u0e49\u0e2d\u0e22 3 \u0e02\u0e49\u0e2d\u0e40\u0e1e\u0e37\u0e48\u0e2d\u0e1c\u0e39\u0e01 Falsifiers \u0e01\u0e31\u0e1a\u0e01\u0e32\u0e23\u0e27\u0e31\u0e14\u0e1c\u0e25\u0e08\u0e23\u0e34\u0e07")
+
+    return notes, fixes, 0.2 if not nv.has_evidence else 0.0, not nv.has_evidence
+
+
+def _logic_extra(nv: _NormView) -> Tuple[List[str], List[str], float, bool]:
+    notes: List[str] = []
+    fixes: List[str] = []
+
+    if nv.options_count < 2:
+        notes.append("Decision set has fewer than 2 options \u2014 weak counterfactual reasoning.")
+        fixes.append("\u0e2a\u0e23\u0e49\u0e32\u0e07\u0e2d\u0e22\u0e48\u0e32\u0e07\u0e19\u0e49\u0e2d\u0e22 2 \u0e17\u0e32\u0e07\u0e40\u0e25\u0e37\u0e2d\u0e01 (Safe/Balanced/Aggressive) \u0e2b\u0e23\u0e37\u0e2d\u0e23\u0e30\u0e1a\u0e38\u0e40\u0e2b\u0e15\u0e38\u0e1c\u0e25\u0e27\u0e48\u0e32\u0e17\u0e33\u0e44\u0e21\u0e21\u0e35\u0e17\u0e32\u0e07\u0e40\u0e14\u0e35\u0e22\u0e27")
+
+    # Minimal systemic sanity: at least one bottleneck or loop or delay
+    if len(nv.loops) == 0 and len(nv.delays) == 0 and len(nv.bottlenecks) == 0:
+        notes.append("World model lacks loops/delays/bottlenecks \u2014 risk of linear reasoning.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Loops/Delays/Bottlenecks \u0e2d\u0e22\u0e48\u0e32\u0e07\u0e19\u0e49\u0e2d\u0e22\u0e2d\u0e22\u0e48\u0e32\u0e07\u0e25\u0e30 1 (\u0e2b\u0e23\u0e37\u0e2d\u0e2d\u0e18\u0e34\u0e1a\u0e32\u0e22\u0e27\u0e48\u0e32\u0e17\u0e33\u0e44\u0e21\u0e44\u0e21\u0e48\u0e21\u0e35)")
+
+    return notes, fixes, 0.15 if nv.options_count < 2 else 0.0, nv.options_count < 2
+
+
+def _risk_extra(nv: _NormView) -> Tuple[List[str], List[str], float, bool]:
+    notes: List[str] = []
+    fixes: List[str] = []
+
+    # Require staged execution for public systems
+    if len(nv.stages) == 0:
+        notes.append("Action plan has no stages \u2014 public rollouts should be staged by default.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Stages (Pilot \u2192 Limited rollout \u2192 Scale) \u0e1e\u0e23\u0e49\u0e2d\u0e21\u0e40\u0e01\u0e13\u0e11\u0e4c\u0e1c\u0e48\u0e32\u0e19\u0e41\u0e15\u0e48\u0e25\u0e30\u0e14\u0e48\u0e32\u0e19")
+
+    if not nv.thresholds or not nv.instrumentation:
+        notes.append("Missing instrumentation/thresholds \u2014 cannot detect failure early.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Instrumentation + Metrics/Thresholds \u0e40\u0e1e\u0e37\u0e48\u0e2d\u0e43\u0e2b\u0e49 kill-switch \u0e17\u0e33\u0e07\u0e32\u0e19\u0e44\u0e14\u0e49\u0e08\u0e23\u0e34\u0e07")
+
+    return notes, fixes, 0.15 if len(nv.stages) == 0 else 0.0, len(nv.stages) == 0
+
+
+def _bias_extra(nv: _NormView) -> Tuple[List[str], List[str], float, bool]:
+    notes: List[str] = []
+    fixes: List[str] = []
+
+    # Narrative drift heuristic: if ES facts thin but DS confident language
+    if len(nv.facts) < 3 and nv.has_option_a_or_list:
+        notes.append("Low fact count with active decisions \u2014 potential confirmation bias.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Facts/Unknowns \u0e41\u0e25\u0e30\u0e43\u0e2a\u0e48 counterarguments \u0e2d\u0e22\u0e48\u0e32\u0e07\u0e19\u0e49\u0e2d\u0e22 2 \u0e02\u0e49\u0e2d\u0e43\u0e19 DS/WM")
+
+    return notes, fixes, 0.1 if len(nv.facts) < 3 else 0.0, False
+
+
+def _clarity_extra(nv: _NormView) -> Tuple[List[str], List[str], float, bool]:
+    notes: List[str] = []
+    fixes: List[str] = []
+
+    if not _is_nonempty_str(nv.citizen_summary):
+        notes.append("Citizen-facing summary not found.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Citizen Summary (\u0e22\u0e48\u0e2d 8\u201312 \u0e1a\u0e23\u0e23\u0e17\u0e31\u0e14) \u0e2d\u0e18\u0e34\u0e1a\u0e32\u0e22\u0e1c\u0e25\u0e25\u0e31\u0e1e\u0e18\u0e4c/\u0e02\u0e31\u0e49\u0e19\u0e15\u0e2d\u0e19/\u0e2a\u0e34\u0e17\u0e18\u0e34\u0e2d\u0e38\u0e17\u0e18\u0e23\u0e13\u0e4c")
+
+    if not nv.checklist:
+        notes.append("Execution checklist missing \u2014 hard to operationalize.")
+        fixes.append("\u0e40\u0e1e\u0e34\u0e48\u0e21 Execution checklist \u0e2a\u0e33\u0e2b\u0e23\u0e31\u0e1a\u0e40\u0e08\u0e49\u0e32\u0e2b\u0e19\u0e49\u0e32\u0e17\u0e35\u0e48 (\u0e02\u0e31\u0e49\u0e19\u0e15\u0e2d\u0e19\u0e2a\u0e31\u0e49\u0e19 \u0e46 \u0e43\u0e0a\u0e49\u0e07\u0e32\u0e19\u0e44\u0e14\u0e49\u0e08\u0e23\u0e34\u0e07)")
+
+    return notes, fixes, 0.1 if not nv.citizen_summary else 0.0, not _is_nonempty_str(nv.citizen_summary)
+
+
+def _actors_or_incentives(nv: _NormView) -> List[Any]:
+    return nv.actors if nv.actors else nv.incentives
+
+
+_GATE_SPECS: Tuple[_GateSpec, ...] = (
+    _GateSpec(
+        name="Truth Gate",
+        required=(
+            ("ES.Facts", "facts"),
+            ("ES.Assumptions", "assumptions"),
+            ("FPF.Falsifiers", "falsifiers"),
+        ),
+        missing_fix="\u0e40\u0e15\u0e34\u0e21 ES: \u0e41\u0e22\u0e01 Facts/Assumptions \u0e43\u0e2b\u0e49\u0e0a\u0e31\u0e14 \u0e41\u0e25\u0e30\u0e43\u0e2a\u0e48 FPF.Falsifiers \u0e2d\u0e22\u0e48\u0e32\u0e07\u0e19\u0e49\u0e2d\u0e22 3 \u0e02\u0e49\u0e2d",
+        extra_check=_truth_extra,
+    ),
+    _GateSpec(
+        name="Logic Gate",
+        required=(
+            ("WM.Causal structure", "causal"),
+            ("FPF.Variables", "variables"),
+            ("FPF.Levers", "levers"),
+        ),
+        missing_fix="\u0e40\u0e15\u0e34\u0e21 WM.Causal structure + FPF.Variables/Levers \u0e40\u0e1e\u0e37\u0e48\u0e2d\u0e43\u0e2b\u0e49\u0e40\u0e2b\u0e15\u0e38\u0e1c\u0e25\u0e04\u0e23\u0e1a\u0e27\u0e07\u0e08\u0e23",
+        extra_check=_logic_extra,
+    ),
+    _GateSpec(
+        name="Risk Gate",
+        required=(
+            ("DS.Global downside bound", "downside"),
+            ("AP.Rollback", "rollback"),
+            ("AP.Kill-switch", "kill_switch"),
+        ),
+        missing_fix="\u0e01\u0e33\u0e2b\u0e19\u0e14 Downside bound + Rollback + Kill-switch \u0e43\u0e2b\u0e49\u0e0a\u0e31\u0e14 (\u0e2b\u0e49\u0e32\u0e21 deploy \u0e16\u0e49\u0e32\u0e44\u0e21\u0e48\u0e21\u0e35)",
+        extra_check=_risk_extra,
+    ),
+    _GateSpec(
+        name="Bias Gate",
+        required=(
+            ("SM.Actors/Incentives", _actors_or_incentives),
+            ("SM.Corruption surfaces", "corruption"),
+            ("SM.Hidden costs/externalities", "hidden_costs"),
+        ),
+        missing_fix="\u0e40\u0e15\u0e34\u0e21 System Map: Actors/Incentives + Hidden costs + Corruption surfaces \u0e40\u0e1e\u0e37\u0e48\u0e2d\u0e01\u0e31\u0e19 bias \u0e40\u0e0a\u0e34\u0e07\u0e2d\u0e33\u0e19\u0e32\u0e08",
+        extra_check=_bias_extra,
+    ),
+    _GateSpec(
+        name="Clarity Gate",
+        required=(
+            ("IC.Goal", "goal"),
+            ("IC.Deliverable", "deliverable"),
+            ("IC.Success metrics", "success_metrics"),
+        ),
+        missing_fix="\u0e40\u0e15\u0e34\u0e21 IC: Goal/Deliverable/Success metrics \u0e40\u0e1e\u0e37\u0e48\u0e2d\u0e04\u0e27\u0e32\u0e21\u0e0a\u0e31\u0e14\u0e40\u0e08\u0e19\u0e23\u0e30\u0e14\u0e31\u0e1a 1 \u0e2b\u0e19\u0e49\u0e32",
+        extra_check=_clarity_extra,
+    ),
+)
 
 
 # -----------------------------
@@ -141,32 +538,41 @@ def _count_missing_required(required: List[Tuple[str, Any]]) -> List[str]:
 class AuditGate:
     CODEX_ID = "CIVIC-OS-TH v1.0"
 
-    def __init__(self, strict: bool = True):
+    def __init__(self, strict: bool = True, fail_fast: bool = False):
         """
         strict=True means missing critical fields => FAIL.
+        fail_fast=True stops after the first failed gate and marks the
+        remaining gates SKIPPED \u2014 the deploy-allow bit is already decided,
+        so later gates' work can be skipped. Keep the default (full
+        evaluation) for regulator-facing reports.
         """
         self.strict = strict
+        self.fail_fast = fail_fast
 
     def evaluate(self, ctx: AuditContext) -> AuditReport:
         artifacts = ctx.artifacts or {}
         metadata = ctx.metadata or {}
 
-        truth = self._truth_gate(artifacts)
-        logic = self._logic_gate(artifacts)
-        risk = self._risk_gate(artifacts)
-        bias = self._bias_gate(artifacts)
-        clarity = self._clarity_gate(artifacts)
+        # Normalize once; all gates read from the same flat view.
+        nv = _normalize(artifacts)
 
-        gate_results = [truth, logic, risk, bias, clarity]
-        overall = "PASS" if all(gr.verdict == "PASS" for gr in gate_results) else "FAIL"
-
-        # Minimum fixes: take first fixes from failed gates (de-dup)
-        fixes: List[str] = []
-        for gr in gate_results:
+        gate_results: List[GateResult] = []
+        failed = False
+        for spec in _GATE_SPECS:
+            if failed and self.fail_fast:
+                gate_results.append(GateResult(spec.name, "SKIPPED"))
+                continue
+            gr = self._run_gate(spec, nv)
             if gr.verdict == "FAIL":
-                for f in gr.fixes:
-                    if f not in fixes:
-                        fixes.append(f)
+                failed = True
+            gate_results.append(gr)
+
+        overall = "FAIL" if failed else "PASS"
+
+        # Minimum fixes: take fixes from failed gates (de-dup, first-seen order)
+        fixes = list(dict.fromkeys(
+            f for gr in gate_results if gr.verdict == "FAIL" for f in gr.fixes
+        ))
 
         summary = self._summary(overall, gate_results)
 
@@ -179,246 +585,39 @@ class AuditGate:
             minimum_fixes=fixes[:8],  # keep concise
             metadata={
                 "strict": self.strict,
+                "fail_fast": self.fail_fast,
                 **metadata,
             },
         )
 
     # -------------------------
-    # Gate 1: Truth
-    # -------------------------
-    def _truth_gate(self, artifacts: Dict[str, Any]) -> GateResult:
-        es = artifacts.get("ES") or {}
-        fpf = artifacts.get("FPF") or {}
-        ds = artifacts.get("DS") or {}
-
-        notes: List[str] = []
-        fixes: List[str] = []
-
-        facts = _as_list(es.get("Facts") or es.get("facts"))
-        assumptions = _as_list(es.get("Assumptions") or es.get("assumptions"))
-        unknowns = _as_list(es.get("Unknowns") or es.get("unknowns"))
-        data_risks = _as_list(es.get("Data risks") or es.get("DataRisks") or es.get("data_risks"))
-
-        falsifiers = _as_list(fpf.get("Falsifiers") or fpf.get("falsifiers"))
-        minimal_tests = _as_list(fpf.get("Minimal tests") or fpf.get("MinimalTests") or fpf.get("minimal_tests"))
-
-        # Required
-        required = [
-            ("ES.Facts", facts),
-            ("ES.Assumptions", assumptions),
-            ("FPF.Falsifiers", falsifiers),
-        ]
-        missing = _count_missing_required(required)
-
-        if missing:
-            notes.append(f"Missing required fields: {', '.join(missing)}")
-            fixes.append("เติม ES: แยก Facts/Assumptions ให้ชัด และใส่ FPF.Falsifiers อย่างน้อย 3 ข้อ")
-
-        # Evidence presence heuristic
-        if not _has_any_textual_evidence(es):
-            notes.append("Evidence looks weak: no sources or fact statements detected.")
-            fixes.append("เพิ่มหลักฐาน: ใส่ Facts ที่ตรวจสอบได้ + Sources (ลิงก์/เอกสาร/ข้อมูลตัวอย่าง)")
-
-        # Claims sanity: if DS has options but ES empty => likely narrative
-        if (ds.get("Option A") or ds.get("OptionA") or ds.get("options")) and len(facts) == 0:
-            notes.append("Decisions exist but no facts listed — risk of narrative-driven decision.")
-            fixes.append("ก่อนตัดสินใจ: ใส่ Facts อย่างน้อย 5 ข้อ + ระบุ Unknowns ที่สำคัญ")
-
-        # Testability
-        if falsifiers and len(minimal_tests) == 0:
-            notes.append("Falsifiers exist but minimal tests not specified.")
-            fixes.append("เพิ่ม Minimal tests อย่างน้อย 3 ข้อเพื่อผูก Falsifiers กับการวัดผลจริง")
-
-        score = self._score_from(missing=len(missing), penalties=0.2 if not _has_any_textual_evidence(es) else 0.0)
-        verdict = "PASS" if len(missing) == 0 and _has_any_textual_evidence(es) else "FAIL"
-
-        return GateResult("Truth Gate", verdict, notes, fixes, score)
-
-    # -------------------------
-    # Gate 2: Logic
-    # -------------------------
-    def _logic_gate(self, artifacts: Dict[str, Any]) -> GateResult:
-        wm = artifacts.get("WM") or {}
-        ds = artifacts.get("DS") or {}
-        fpf = artifacts.get("FPF") or {}
-
-        notes: List[str] = []
-        fixes: List[str] = []
-
-        causal = wm.get("Causal structure") or wm.get("causal_structure") or wm.get("CausalStructure")
-        loops = _as_list(wm.get("Loops") or wm.get("loops"))
-        delays = _as_list(wm.get("Delays") or wm.get("delays"))
-        bottlenecks = _as_list(wm.get("Bottlenecks") or wm.get("bottlenecks"))
-
-        # For decisions: require at least two options OR explicit rationale for single option
-        optA = ds.get("Option A") or ds.get("OptionA")
-        optB = ds.get("Option B") or ds.get("OptionB")
-        optC = ds.get("Option C") or ds.get("OptionC")
-        options_list = ds.get("options")
-        options_count = 0
-        options_count += 1 if optA else 0
-        options_count += 1 if optB else 0
-        options_count += 1 if optC else 0
-        if isinstance(options_list, list):
-            options_count = max(options_count, len(options_list))
-
-        levers = _as_list(fpf.get("Levers") or fpf.get("levers"))
-        variables = _as_list(fpf.get("Variables") or fpf.get("variables"))
-
-        required = [
-            ("WM.Causal structure", causal),
-            ("FPF.Variables", variables),
-            ("FPF.Levers", levers),
-        ]
-        missing = _count_missing_required(required)
-
-        if missing:
-            notes.append(f"Missing required fields: {', '.join(missing)}")
-            fixes.append("เติม WM.Causal structure + FPF.Variables/Levers เพื่อให้เหตุผลครบวงจร")
-
-        if options_count < 2:
-            notes.append("Decision set has fewer than 2 options — weak counterfactual reasoning.")
-            fixes.append("สร้างอย่างน้อย 2 ทางเลือก (Safe/Balanced/Aggressive) หรือระบุเหตุผลว่าทำไมมีทางเดียว")
-
-        # Minimal systemic sanity: at least one bottleneck or loop or delay
-        if len(loops) == 0 and len(delays) == 0 and len(bottlenecks) == 0:
-            notes.append("World model lacks loops/delays/bottlenecks — risk of linear reasoning.")
-            fixes.append("เพิ่ม Loops/Delays/Bottlenecks อย่างน้อยอย่างละ 1 (หรืออธิบายว่าทำไมไม่มี)")
-
-        score = self._score_from(missing=len(missing), penalties=0.15 if options_count < 2 else 0.0)
-        verdict = "PASS" if len(missing) == 0 and options_count >= 2 else "FAIL"
-
-        return GateResult("Logic Gate", verdict, notes, fixes, score)
-
-    # -------------------------
-    # Gate 3: Risk
+    # Generic gate engine
     # -------------------------
-    def _risk_gate(self, artifacts: Dict[str, Any]) -> GateResult:
-        ds = artifacts.get("DS") or {}
-        ap = artifacts.get("AP") or {}
-
+    def _run_gate(self, spec: _GateSpec, nv: _NormView) -> GateResult:
         notes: List[str] = []
         fixes: List[str] = []
 
-        downside = ds.get("Global downside bound") or ds.get("GlobalDownsideBound") or ds.get("DownsideBound")
-        rollback = ds.get("Rollback plan") or ds.get("Rollback") or ap.get("Rollback") or ap.get("rollback")
-        kill_switch = ds.get("Kill-switch") or ds.get("KillSwitch") or ap.get("Kill-switch") or ap.get("KillSwitch")
-
-        stages = _as_list(ap.get("Stages") or ap.get("stages") or ap.get("Steps") or ap.get("steps"))
-        thresholds = ap.get("Thresholds") or ap.get("thresholds") or ap.get("Metrics & thresholds") or ap.get("metrics_thresholds")
-        instrumentation = ap.get("Instrumentation") or ap.get("instrumentation")
-
         required = [
-            ("DS.Global downside bound", downside),
-            ("AP.Rollback", rollback),
-            ("AP.Kill-switch", kill_switch),
+            (label, src(nv) if callable(src) else getattr(nv, src))
+            for label, src in spec.required
         ]
         missing = _count_missing_required(required)
 
         if missing:
             notes.append(f"Missing required fields: {', '.join(missing)}")
-            fixes.append("กำหนด Downside bound + Rollback + Kill-switch ให้ชัด (ห้าม deploy ถ้าไม่มี)")
-
-        # Require staged execution for public systems
-        if len(stages) == 0:
-            notes.append("Action plan has no stages — public rollouts should be staged by default.")
-            fixes.append("เพิ่ม Stages (Pilot → Limited rollout → Scale) พร้อมเกณฑ์ผ่านแต่ละด่าน")
-
-        if not thresholds or not instrumentation:
-            notes.append("Missing instrumentation/thresholds — cannot detect failure early.")
-            fixes.append("เพิ่ม Instrumentation + Metrics/Thresholds เพื่อให้ kill-switch ทำงานได้จริง")
-
-        score = self._score_from(missing=len(missing), penalties=0.15 if len(stages) == 0 else 0.0)
-        verdict = "PASS" if len(missing) == 0 and len(stages) > 0 else "FAIL"
-
-        return GateResult("Risk Gate", verdict, notes, fixes, score)
-
-    # -------------------------
-    # Gate 4: Bias
-    # -------------------------
-    def _bias_gate(self, artifacts: Dict[str, Any]) -> GateResult:
-        sm = artifacts.get("SM") or {}
-        es = artifacts.get("ES") or {}
-        ds = artifacts.get("DS") or {}
-
-        notes: List[str] = []
-        fixes: List[str] = []
-
-        actors = _as_list(sm.get("Actors & incentives") or sm.get("Actors") or sm.get("actors"))
-        incentives = _as_list(sm.get("Incentives") or sm.get("incentives"))
-        corruption = _as_list(sm.get("Corruption surfaces") or sm.get("corruption_surfaces"))
-        hidden_costs = _as_list(sm.get("Hidden costs/externalities") or sm.get("hidden_costs"))
-
-        # Bias checks: require at least one incentive statement and one risk surface
-        required = [
-            ("SM.Actors/Incentives", actors if actors else incentives),
-            ("SM.Corruption surfaces", corruption),
-            ("SM.Hidden costs/externalities", hidden_costs),
-        ]
-        missing = _count_missing_required(required)
-
-        if missing:
-            notes.append(f"Missing required fields: {', '.join(missing)}")
-            fixes.append("เติม System Map: Actors/Incentives + Hidden costs + Corruption surfaces เพื่อกัน bias เชิงอำนาจ")
-
-        # Narrative drift heuristic: if ES facts thin but DS confident language
-        facts = _as_list(es.get("Facts") or es.get("facts"))
-        if len(facts) < 3 and (ds.get("Option A") or ds.get("OptionA") or ds.get("options")):
-            notes.append("Low fact count with active decisions — potential confirmation bias.")
-            fixes.append("เพิ่ม Facts/Unknowns และใส่ counterarguments อย่างน้อย 2 ข้อใน DS/WM")
-
-        score = self._score_from(missing=len(missing), penalties=0.1 if len(facts) < 3 else 0.0)
-        verdict = "PASS" if len(missing) == 0 else "FAIL"
-
-        return GateResult("Bias Gate", verdict, notes, fixes, score)
-
-    # -------------------------
-    # Gate 5: Clarity
-    # -------------------------
-    def _clarity_gate(self, artifacts: Dict[str, Any]) -> GateResult:
-        ic = artifacts.get("IC") or {}
-        ap = artifacts.get("AP") or {}
-        # allow citizen summary anywhere
-        citizen_summary = (
-            artifacts.get("CitizenSummary")
-            or ic.get("Citizen summary")
-            or ic.get("citizen_summary")
-            or ap.get("Citizen summary")
-            or ap.get("citizen_summary")
-        )
-
-        notes: List[str] = []
-        fixes: List[str] = []
-
-        goal = ic.get("Goal") or ic.get("goal")
-        deliverable = ic.get("Deliverable") or ic.get("deliverable")
-        success_metrics = ic.get("Success metrics") or ic.get("success_metrics")
-
-        checklist = ap.get("Execution checklist") or ap.get("checklist") or ap.get("Checklist")
-
-        required = [
-            ("IC.Goal", goal),
-            ("IC.Deliverable", deliverable),
-            ("IC.Success metrics", success_metrics),
-        ]
-        missing = _count_missing_required(required)
-
-        if missing:
-            notes.append(f"Missing required fields: {', '.join(missing)}")
-            fixes.append("เติม IC: Goal/Deliverable/Success metrics เพื่อความชัดเจนระดับ 1 หน้า")
-
-        if not _is_nonempty_str(citizen_summary):
-            notes.append("Citizen-facing summary not found.")
-            fixes.append("เพิ่ม Citizen Summary (ย่อ 8–12 บรรทัด) อธิบายผลลัพธ์/ขั้นตอน/สิทธิอุทธรณ์")
+            fixes.append(spec.missing_fix)
 
-        if not checklist:
-            notes.append("Execution checklist missing — hard to operationalize.")
-            fixes.append("เพิ่ม Execution checklist สำหรับเจ้าหน้าที่ (ขั้นตอนสั้น ๆ ใช้งานได้จริง)")
+        penalty = 0.0
+        extra_fail = False
+        if spec.extra_check is not None:
+            extra_notes, extra_fixes, penalty, extra_fail = spec.extra_check(nv)
+            notes += extra_notes
+            fixes += extra_fixes
 
-        score = self._score_from(missing=len(missing), penalties=0.1 if not citizen_summary else 0.0)
-        verdict = "PASS" if len(missing) == 0 and _is_nonempty_str(citizen_summary) else "FAIL"
+        score = self._score_from(missing=len(missing), penalties=penalty)
+        verdict = "PASS" if len(missing) == 0 and not extra_fail else "FAIL"
 
-        return GateResult("Clarity Gate", verdict, notes, fixes, score)
+        return GateResult(spec.name, verdict, notes, fixes, score)
 
     # -------------------------
     # Utilities
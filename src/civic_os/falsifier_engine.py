@@ -1,3 +1,4 @@
+"""
 CIVIC-OS Falsifier Engine
 Evaluates whether observed metrics falsify the current decision/model.
 
@@ -18,16 +19,31 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import json
+import math
+import sys
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Final, List, Optional, Tuple, Union
+
 
+def _canonical_json_bytes(obj: Any) -> bytes:
+    """Canonical form (sorted keys, tight separators) as UTF-8 bytes; matches
+    the form SignedMemory uses for payloads."""
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
-@dataclass
+
+@dataclass(slots=True)
 class MetricsSnapshot:
     """
     Current observed metrics. Use raw numbers as floats/ints where possible.
 
+    slots=True gives fixed-offset attribute access with no per-instance
+    __dict__; a NamedTuple (or frozen=True) would do the same but cannot
+    hold the lazily written vector caches below, so this is as lean as the
+    snapshot gets while keeping vectors() memoized.
+
     Recommended keys:
       - service_latency_median
       - service_latency_p90
@@ -43,9 +59,23 @@ class MetricsSnapshot:
     baseline: Optional[Dict[str, Any]] = None  # pre-change baseline
     window: str = "unknown"  # e.g., "weekly", "monthly"
     metadata: Dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass
+    _cur_vec: Optional[Tuple[float, ...]] = field(default=None, repr=False, compare=False)
+    _base_vec: Optional[Tuple[float, ...]] = field(default=None, repr=False, compare=False)
+
+    def vectors(self) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """
+        Packed (current, baseline) metric vectors in _METRIC_ORDER, computed
+        on first use and cached on the snapshot; the metric dicts are treated
+        as read-only after construction. Re-evaluating the same snapshot
+        (e.g. against several engines/thresholds) skips the repacking.
+        """
+        if self._cur_vec is None:
+            self._cur_vec = _pack(self.current)
+            self._base_vec = _pack(self.baseline)
+        return self._cur_vec, self._base_vec  # type: ignore[return-value]
+
+
+@dataclass(slots=True)
 class FalsifierHit:
     code: str
     title: str
@@ -54,37 +84,58 @@ class FalsifierHit:
     recommendation: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FalsifierResult:
+    """
+    Result of a falsifier evaluation. Treated as immutable after evaluate()
+    returns; to_dict() caches its output under that invariant.
+    """
     timestamp_utc: str
     verdict: str  # "OK" | "FALSIFIED"
     hits: List[FalsifierHit]
     summary: str
     recommended_actions: List[str]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, repr=False, compare=False)
+    _bytes_cache: Optional[bytes] = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp_utc": self.timestamp_utc,
-            "verdict": self.verdict,
-            "summary": self.summary,
-            "recommended_actions": self.recommended_actions,
-            "hits": [
-                {
-                    "code": h.code,
-                    "title": h.title,
-                    "severity": h.severity,
-                    "evidence": h.evidence,
-                    "recommendation": h.recommendation,
-                }
-                for h in self.hits
-            ],
-            "metadata": self.metadata,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "timestamp_utc": self.timestamp_utc,
+                "verdict": self.verdict,
+                "summary": self.summary,
+                "recommended_actions": self.recommended_actions,
+                "hits": [
+                    {
+                        "code": h.code,
+                        "title": h.title,
+                        "severity": h.severity,
+                        "evidence": h.evidence,
+                        "recommendation": h.recommendation,
+                    }
+                    for h in self.hits
+                ],
+                "metadata": self.metadata,
+            }
+        return self._dict_cache
+
+    def to_canonical_bytes(self) -> bytes:
+        """Canonical JSON bytes of to_dict(), cached; reusable as a signed-log
+        payload without re-serializing."""
+        if self._bytes_cache is None:
+            self._bytes_cache = _canonical_json_bytes(self.to_dict())
+        return self._bytes_cache
 
 
 def _now_utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # time.gmtime + f-string is several times cheaper than constructing a
+    # datetime and calling isoformat(); second precision is enough for reports.
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}+00:00"
+    )
 
 
 def _num(x: Any) -> Optional[float]:
@@ -104,6 +155,276 @@ def _pct_change(cur: Optional[float], base: Optional[float]) -> Optional[float]:
     return (cur - base) / abs(base)
 
 
+# -----------------------------
+# Numeric kernel
+# -----------------------------
+# Canonical slot order for the packed metric vectors (NaN = missing).
+# Interned so packing and evidence construction reuse one allocation per key
+# and dict lookups hit the pointer-equality fast path.
+_METRIC_ORDER = tuple(sys.intern(k) for k in (
+    "service_latency_median",
+    "error_rate",
+    "throughput",
+    "disparity_index",
+    "transparency_coverage",
+    "shadow_paperwork_index",
+    "citizen_burden_index",
+))
+_LAT, _ERR, _THR, _DISP, _TRANS, _SHADOW, _BURDEN = range(len(_METRIC_ORDER))
+
+_NAN = float("nan")
+
+# Rule bits returned by _eval_flags.
+_F_LAT_DOWN_ERR_UP = 1 << 0
+_F_THROUGHPUT_DISPARITY = 1 << 1
+_F_TRANSPARENCY_LOW = 1 << 2
+_F_SHADOW_GROWS = 1 << 3
+_F_BURDEN_UP = 1 << 4
+_F_ERROR_EXTREME = 1 << 5
+
+_ERROR_RATE_EXTREME = 0.20
+
+# Falsifier codes, interned once: every hit shares the same string object and
+# equality checks against these constants short-circuit on identity.
+CODE_BASELINE_MISSING: Final = sys.intern("baseline_missing")
+CODE_LATENCY_DOWN_ERRORS_UP: Final = sys.intern("latency_down_errors_up")
+CODE_THROUGHPUT_UP_DISPARITY_UP: Final = sys.intern("throughput_up_disparity_up")
+CODE_TRANSPARENCY_UNVERIFIABLE: Final = sys.intern("transparency_claims_unverifiable_logs")
+CODE_SHADOW_PAPERWORK_GROWS: Final = sys.intern("shadow_paperwork_grows")
+CODE_BURDEN_UP_AFTER_DIGITAL: Final = sys.intern("citizen_burden_up_after_digital")
+CODE_ERROR_RATE_EXTREME: Final = sys.intern("error_rate_extreme")
+
+_OK_SUMMARY = "OK — No high-severity falsifiers triggered. Continue staged monitoring."
+
+
+# -----------------------------
+# Hit templates
+# -----------------------------
+# Static (title, severity, recommendation) per falsifier code. Hits built via
+# _make_hit reference these shared constants instead of rebuilding the string
+# literals and list objects on every evaluate() call.
+_HIT_TEMPLATES: Dict[str, Tuple[str, str, str]] = {
+    CODE_BASELINE_MISSING: (
+        "Baseline missing (cannot compute falsifiers reliably)",
+        "MEDIUM",
+        "Provide baseline metrics (pre-change) or mark this as exploratory pilot only.",
+    ),
+    CODE_LATENCY_DOWN_ERRORS_UP: (
+        "Latency improved but error rate worsened (dashboard theatre risk)",
+        "HIGH",
+        "Trigger rollback or tighten validation gates; optimize correctness before speed.",
+    ),
+    CODE_THROUGHPUT_UP_DISPARITY_UP: (
+        "Throughput improved but disparity widened (fairness regression)",
+        "HIGH",
+        "Pause scaling; add equity constraints and re-run pilot with bias monitoring.",
+    ),
+    CODE_TRANSPARENCY_UNVERIFIABLE: (
+        "Transparency coverage below minimum (claims not supportable)",
+        "MEDIUM",
+        "Increase traceability/logging coverage before claiming transparency improvements.",
+    ),
+    CODE_SHADOW_PAPERWORK_GROWS: (
+        "Shadow paperwork increased (work shifted outside the system)",
+        "HIGH",
+        "Stop rollout; redesign workflow to eliminate off-system steps; audit incentives.",
+    ),
+    CODE_BURDEN_UP_AFTER_DIGITAL: (
+        "Citizen burden increased after digitization (UX regression)",
+        "HIGH",
+        "Rollback UX/process; reduce steps/docs/trips; validate with citizen journey tests.",
+    ),
+    CODE_ERROR_RATE_EXTREME: (
+        "Error rate extremely high (unsafe to scale)",
+        "HIGH",
+        "Do not scale. Add validation, training, and staged gates immediately.",
+    ),
+}
+
+# Recommended actions per falsifier code (immutable, shared across calls).
+_HIT_ACTIONS: Dict[str, Tuple[str, ...]] = {
+    CODE_BASELINE_MISSING: (
+        "เติม baseline metrics ก่อนสรุปผล (หรือประกาศว่าเป็น pilot exploratory)",
+    ),
+    CODE_LATENCY_DOWN_ERRORS_UP: (
+        "สั่งหยุดขยายผล (freeze rollout) และทำ rollback หากจำเป็น",
+        "เพิ่ม Audit/Validation ขั้นกลางก่อนจุดอนุมัติ (ลด error ก่อนลดเวลา)",
+    ),
+    CODE_THROUGHPUT_UP_DISPARITY_UP: (
+        "หยุด scale และใส่ equity constraints (สิทธิ/การเข้าถึง) เป็นเงื่อนไขบังคับ",
+        "เพิ่ม monitoring แยกตามพื้นที่/กลุ่ม และตั้ง threshold disparity",
+    ),
+    CODE_TRANSPARENCY_UNVERIFIABLE: (
+        "เพิ่ม trace/log coverage ให้เกินเกณฑ์ขั้นต่ำก่อนประกาศความโปร่งใส",
+    ),
+    CODE_SHADOW_PAPERWORK_GROWS: (
+        "หยุด rollout และ map ขั้นตอนเงา (shadow steps) ออกมาให้ครบ",
+        "ปรับ incentive/KPI ให้รางวัลกับ outcome ไม่ใช่การหลบระบบ",
+    ),
+    CODE_BURDEN_UP_AFTER_DIGITAL: (
+        "ทำ citizen journey test ใหม่ และลด steps/docs/trips ให้ชัด",
+        "ตั้ง policy: digitization must reduce burden (ไม่งั้นถือว่าล้มเหลว)",
+    ),
+    CODE_ERROR_RATE_EXTREME: (
+        "ห้าม scale; เพิ่ม validation/training และทำ staged rollout",
+    ),
+}
+
+
+def _make_hit(code: str, evidence: Dict[str, Any]) -> FalsifierHit:
+    """Builds a FalsifierHit from the shared template for the given code."""
+    title, severity, recommendation = _HIT_TEMPLATES[code]
+    return FalsifierHit(
+        code=code,
+        title=title,
+        severity=severity,
+        evidence=evidence,
+        recommendation=recommendation,
+    )
+
+
+def _pack(d: Optional[Dict[str, Any]]) -> Tuple[float, ...]:
+    """Packs a metrics dict into the canonical float vector (NaN = missing)."""
+    if not d:
+        return (_NAN,) * len(_METRIC_ORDER)
+    out = []
+    for k in _METRIC_ORDER:
+        n = _num(d.get(k))
+        out.append(_NAN if n is None else n)
+    return tuple(out)
+
+
+@functools.lru_cache(maxsize=256)
+def _inv_abs(base: Tuple[float, ...]) -> Tuple[float, ...]:
+    """
+    Per-slot reciprocal 1/|b| of a packed baseline vector (NaN when the slot
+    is missing or zero). Fractional change then becomes (c - b) * inv instead
+    of a division per slot, and because baselines are typically fixed across
+    many windows, the memoization computes the divisions once per distinct
+    baseline rather than once per evaluation. NaN propagates through the
+    multiply, so missing/zero-base slots yield NaN exactly as before.
+    """
+    return tuple(_NAN if math.isnan(b) or b == 0.0 else 1.0 / abs(b) for b in base)
+
+
+# Slot order for the packed threshold tuple consumed by _eval_flags.
+_THRESHOLD_ORDER = (
+    "latency_improve",
+    "error_worsen",
+    "throughput_improve",
+    "disparity_worsen",
+    "transparency_min",
+    "burden_worsen",
+    "shadow_paperwork_worsen",
+)
+(_T_LAT_IMP, _T_ERR_WORSE, _T_THR_IMP, _T_DISP_WORSE,
+ _T_TRANS_MIN, _T_BURDEN_WORSE, _T_SHADOW_WORSE) = range(len(_THRESHOLD_ORDER))
+
+
+@dataclass(slots=True, frozen=True)
+class Thresholds:
+    """
+    Falsifier thresholds as an immutable record. Defaults are tuned for
+    public systems; adjust per domain. FalsifierEngine also accepts a plain
+    dict (possibly partial) and coerces it through this record.
+    """
+    latency_improve: float = -0.10        # -10% median latency is "improve"
+    error_worsen: float = 0.10            # +10% error rate is "worsen"
+    throughput_improve: float = 0.10      # +10% throughput is "improve"
+    disparity_worsen: float = 0.05        # +5% disparity index is "worsen"
+    transparency_min: float = 0.60        # must be >= 0.60 to claim improved transparency
+    burden_worsen: float = 0.05           # +5% citizen burden is "worsen"
+    shadow_paperwork_worsen: float = 0.10  # +10% shadow paperwork index is "worsen"
+
+    def to_dict(self) -> Dict[str, float]:
+        return {k: getattr(self, k) for k in _THRESHOLD_ORDER}
+
+
+_DEFAULT_THRESHOLDS = Thresholds()
+
+
+# Flat decode table mapping kernel bits to codes and evidence layouts. Each
+# evidence term is (key, source, slot): source selects the pct vector, the
+# packed current vector, or the packed thresholds. Conditions themselves live
+# in _eval_kernel; this table only reconstructs hits for set bits, and is the
+# natural seam for the custom-falsifier (DSL/YAML) hook mentioned above.
+#
+# transparency_claims_unverifiable_logs is an approximation: logs cannot be
+# verified here without signed_memory integration, so coverage below the
+# minimum stands in for "claims not supportable".
+_EV_PCT, _EV_CUR, _EV_THR = range(3)
+
+_RULE_TABLE: Tuple[Tuple[int, str, Tuple[Tuple[str, int, int], ...]], ...] = (
+    (_F_LAT_DOWN_ERR_UP, CODE_LATENCY_DOWN_ERRORS_UP, (
+        ("service_latency_median_change", _EV_PCT, _LAT),
+        ("error_rate_change", _EV_PCT, _ERR),
+    )),
+    (_F_THROUGHPUT_DISPARITY, CODE_THROUGHPUT_UP_DISPARITY_UP, (
+        ("throughput_change", _EV_PCT, _THR),
+        ("disparity_index_change", _EV_PCT, _DISP),
+    )),
+    (_F_TRANSPARENCY_LOW, CODE_TRANSPARENCY_UNVERIFIABLE, (
+        ("transparency_coverage", _EV_CUR, _TRANS),
+        ("min_required", _EV_THR, _T_TRANS_MIN),
+    )),
+    (_F_SHADOW_GROWS, CODE_SHADOW_PAPERWORK_GROWS, (
+        ("shadow_paperwork_index_change", _EV_PCT, _SHADOW),
+    )),
+    (_F_BURDEN_UP, CODE_BURDEN_UP_AFTER_DIGITAL, (
+        ("citizen_burden_index_change", _EV_PCT, _BURDEN),
+    )),
+    (_F_ERROR_EXTREME, CODE_ERROR_RATE_EXTREME, (
+        ("error_rate", _EV_CUR, _ERR),
+    )),
+)
+
+
+def _eval_kernel(
+    cur: Tuple[float, ...], base: Tuple[float, ...], thr: Tuple[float, ...]
+) -> Tuple[int, Tuple[float, ...]]:
+    """
+    Pure numeric rule kernel: unrolled fixed-slot float arithmetic returning
+    (rule bitmask, pct vector). NaN comparisons are False, so missing metrics
+    never trigger a rule. Deliberately restricted to scalar float math (no
+    dicts, objects or exceptions) so a tracing/AOT compiler could take it
+    unchanged; the repo stays pure Python, so no JIT is wired in.
+    """
+    inv = _inv_abs(base)
+    pct = (
+        (cur[_LAT] - base[_LAT]) * inv[_LAT],
+        (cur[_ERR] - base[_ERR]) * inv[_ERR],
+        (cur[_THR] - base[_THR]) * inv[_THR],
+        (cur[_DISP] - base[_DISP]) * inv[_DISP],
+        (cur[_TRANS] - base[_TRANS]) * inv[_TRANS],
+        (cur[_SHADOW] - base[_SHADOW]) * inv[_SHADOW],
+        (cur[_BURDEN] - base[_BURDEN]) * inv[_BURDEN],
+    )
+    flags = 0
+    if pct[_LAT] <= thr[_T_LAT_IMP] and pct[_ERR] >= thr[_T_ERR_WORSE]:
+        flags |= _F_LAT_DOWN_ERR_UP
+    if pct[_THR] >= thr[_T_THR_IMP] and pct[_DISP] >= thr[_T_DISP_WORSE]:
+        flags |= _F_THROUGHPUT_DISPARITY
+    if cur[_TRANS] < thr[_T_TRANS_MIN]:
+        flags |= _F_TRANSPARENCY_LOW
+    if pct[_SHADOW] >= thr[_T_SHADOW_WORSE]:
+        flags |= _F_SHADOW_GROWS
+    if pct[_BURDEN] >= thr[_T_BURDEN_WORSE]:
+        flags |= _F_BURDEN_UP
+    if cur[_ERR] >= _ERROR_RATE_EXTREME:
+        flags |= _F_ERROR_EXTREME
+    return flags, pct
+
+
+# Memoized front end for the kernel. Monitoring loops often re-evaluate the
+# same (current, baseline, thresholds) triple (unchanged metrics between
+# ticks, re-checks against several engines), and the key tuples are already
+# built by vectors()/_bind_thresholds. NaN slots always hold the shared _NAN
+# object, so tuple equality's identity fast path keeps NaN-bearing keys
+# retrievable despite NaN != NaN. Only the pure numeric step is cached; the
+# result envelope (timestamp, hits, metadata) is rebuilt per call.
+_eval_kernel_cached = functools.lru_cache(maxsize=256)(_eval_kernel)
+
+
 class FalsifierEngine:
     """
     Default canonical falsifiers (codex):
@@ -116,186 +437,138 @@ class FalsifierEngine:
 
     def __init__(
         self,
-        thresholds: Optional[Dict[str, float]] = None,
+        thresholds: Optional[Union[Thresholds, Dict[str, float]]] = None,
         require_baseline: bool = True,
     ):
-        # Default thresholds tuned for public systems; adjust per domain.
-        self.thresholds = {
-            "latency_improve": -0.10,       # -10% median latency is "improve"
-            "error_worsen": 0.10,           # +10% error rate is "worsen"
-            "throughput_improve": 0.10,     # +10% throughput is "improve"
-            "disparity_worsen": 0.05,       # +5% disparity index is "worsen"
-            "transparency_min": 0.60,       # must be >= 0.60 to claim improved transparency
-            "burden_worsen": 0.05,          # +5% citizen burden is "worsen"
-            "shadow_paperwork_worsen": 0.10 # +10% shadow paperwork index is "worsen"
-        }
-        if thresholds:
-            self.thresholds.update(thresholds)
+        if thresholds is None:
+            spec = _DEFAULT_THRESHOLDS
+        elif isinstance(thresholds, Thresholds):
+            spec = thresholds
+        else:
+            # Partial dicts are fine; missing keys take the record defaults,
+            # unknown keys raise instead of being silently carried along.
+            spec = Thresholds(**thresholds)
+        # Kept as a dict for report metadata / serialization.
+        self.thresholds = spec.to_dict()
         self.require_baseline = require_baseline
+        self._bind_thresholds()
+
+    def _bind_thresholds(self) -> None:
+        """
+        Packs self.thresholds into the tuple layout _eval_flags expects, so
+        evaluate() does no per-call dict lookups. Call again after mutating
+        self.thresholds.
+        """
+        self._thr = tuple(self.thresholds[k] for k in _THRESHOLD_ORDER)
 
     def evaluate(self, snap: MetricsSnapshot) -> FalsifierResult:
-        cur = snap.current or {}
-        base = snap.baseline
+        return self._evaluate_one(snap, _now_utc_iso())
 
+    def evaluate_batch(self, snaps: List[MetricsSnapshot]) -> List[FalsifierResult]:
+        """
+        Evaluates many snapshots in one pass (batched monitoring).
+
+        Equivalent to [engine.evaluate(s) for s in snaps], but per-batch setup
+        (timestamp formatting) is paid once instead of per snapshot.
+        """
+        ts = _now_utc_iso()
+        evaluate_one = self._evaluate_one
+        return [evaluate_one(snap, ts) for snap in snaps]
+
+    def _evaluate_one(self, snap: MetricsSnapshot, ts: str) -> FalsifierResult:
         hits: List[FalsifierHit] = []
         actions: List[str] = []
 
-        if self.require_baseline and not base:
+        # Baseline presence is a single truthiness branch (never per-key
+        # probing); missing-metric safety comes from the NaN packing. No
+        # early return here: even without a baseline the absolute checks
+        # (e.g. extreme error rate) must still run.
+        if self.require_baseline and not snap.baseline:
             # Without baseline we can still do absolute checks for some metrics,
             # but we should not declare "FALSIFIED" unless clearly unsafe.
-            hits.append(
-                FalsifierHit(
-                    code="baseline_missing",
-                    title="Baseline missing (cannot compute falsifiers reliably)",
-                    severity="MEDIUM",
-                    evidence={"window": snap.window},
-                    recommendation="Provide baseline metrics (pre-change) or mark this as exploratory pilot only.",
-                )
-            )
-            actions.append("เติม baseline metrics ก่อนสรุปผล (หรือประกาศว่าเป็น pilot exploratory)")
-
-        # Compute changes where possible
-        def ch(key: str) -> Optional[float]:
-            return _pct_change(_num(cur.get(key)), _num(base.get(key)) if base else None)
-
-        # 1) latency_down_errors_up
-        latency_change = ch("service_latency_median")
-        error_change = ch("error_rate")
-        if latency_change is not None and error_change is not None:
-            if latency_change <= self.thresholds["latency_improve"] and error_change >= self.thresholds["error_worsen"]:
-                hits.append(
-                    FalsifierHit(
-                        code="latency_down_errors_up",
-                        title="Latency improved but error rate worsened (dashboard theatre risk)",
-                        severity="HIGH",
-                        evidence={
-                            "service_latency_median_change": latency_change,
-                            "error_rate_change": error_change,
-                        },
-                        recommendation="Trigger rollback or tighten validation gates; optimize correctness before speed.",
-                    )
-                )
-                actions += [
-                    "สั่งหยุดขยายผล (freeze rollout) และทำ rollback หากจำเป็น",
-                    "เพิ่ม Audit/Validation ขั้นกลางก่อนจุดอนุมัติ (ลด error ก่อนลดเวลา)",
-                ]
-
-        # 2) throughput_up_disparity_up
-        throughput_change = ch("throughput")
-        disparity_change = ch("disparity_index")
-        if throughput_change is not None and disparity_change is not None:
-            if throughput_change >= self.thresholds["throughput_improve"] and disparity_change >= self.thresholds["disparity_worsen"]:
-                hits.append(
-                    FalsifierHit(
-                        code="throughput_up_disparity_up",
-                        title="Throughput improved but disparity widened (fairness regression)",
-                        severity="HIGH",
-                        evidence={
-                            "throughput_change": throughput_change,
-                            "disparity_index_change": disparity_change,
-                        },
-                        recommendation="Pause scaling; add equity constraints and re-run pilot with bias monitoring.",
-                    )
-                )
-                actions += [
-                    "หยุด scale และใส่ equity constraints (สิทธิ/การเข้าถึง) เป็นเงื่อนไขบังคับ",
-                    "เพิ่ม monitoring แยกตามพื้นที่/กลุ่ม และตั้ง threshold disparity",
-                ]
-
-        # 3) transparency_claims_unverifiable_logs (approx)
-        # We can't verify logs here without signed_memory integration.
-        # Use a proxy: if transparency_coverage did not improve OR is below minimum,
-        # treat transparency claims as suspect.
-        trans_cur = _num(cur.get("transparency_coverage"))
-        trans_base = _num(base.get("transparency_coverage")) if base else None
-        trans_change = _pct_change(trans_cur, trans_base) if (trans_cur is not None and trans_base is not None) else None
-        if trans_cur is not None:
-            if trans_cur < self.thresholds["transparency_min"]:
-                hits.append(
-                    FalsifierHit(
-                        code="transparency_claims_unverifiable_logs",
-                        title="Transparency coverage below minimum (claims not supportable)",
-                        severity="MEDIUM",
-                        evidence={"transparency_coverage": trans_cur, "min_required": self.thresholds["transparency_min"]},
-                        recommendation="Increase traceability/logging coverage before claiming transparency improvements.",
-                    )
-                )
-                actions.append("เพิ่ม trace/log coverage ให้เกินเกณฑ์ขั้นต่ำก่อนประกาศความโปร่งใส")
-
-        # 4) shadow_paperwork_grows
-        shadow_change = ch("shadow_paperwork_index")
-        if shadow_change is not None and shadow_change >= self.thresholds["shadow_paperwork_worsen"]:
-            hits.append(
-                FalsifierHit(
-                    code="shadow_paperwork_grows",
-                    title="Shadow paperwork increased (work shifted outside the system)",
-                    severity="HIGH",
-                    evidence={"shadow_paperwork_index_change": shadow_change},
-                    recommendation="Stop rollout; redesign workflow to eliminate off-system steps; audit incentives.",
-                )
-            )
-            actions += [
-                "หยุด rollout และ map ขั้นตอนเงา (shadow steps) ออกมาให้ครบ",
-                "ปรับ incentive/KPI ให้รางวัลกับ outcome ไม่ใช่การหลบระบบ",
-            ]
-
-        # 5) citizen_burden_up_after_digital
-        burden_change = ch("citizen_burden_index")
-        if burden_change is not None and burden_change >= self.thresholds["burden_worsen"]:
-            hits.append(
-                FalsifierHit(
-                    code="citizen_burden_up_after_digital",
-                    title="Citizen burden increased after digitization (UX regression)",
-                    severity="HIGH",
-                    evidence={"citizen_burden_index_change": burden_change},
-                    recommendation="Rollback UX/process; reduce steps/docs/trips; validate with citizen journey tests.",
-                )
+            hits.append(_make_hit(CODE_BASELINE_MISSING, {"window": snap.window}))
+            actions += _HIT_ACTIONS[CODE_BASELINE_MISSING]
+
+        # Pack once, compare once: all rule arithmetic happens on fixed-slot
+        # float vectors instead of repeated dict lookups. The packed vectors
+        # are cached on the snapshot, so repeat evaluations skip the packing.
+        cur_vec, base_vec = snap.vectors()
+        flags, pct = _eval_kernel_cached(cur_vec, base_vec, self._thr)
+
+        # Fast path for the common healthy tick: nothing triggered and the
+        # baseline check passed, so skip the per-rule decode entirely.
+        if not flags and not hits:
+            return FalsifierResult(
+                timestamp_utc=ts,
+                verdict="OK",
+                hits=hits,
+                summary=_OK_SUMMARY,
+                recommended_actions=actions,
+                metadata=self._result_metadata(snap),
             )
-            actions += [
-                "ทำ citizen journey test ใหม่ และลด steps/docs/trips ให้ชัด",
-                "ตั้ง policy: digitization must reduce burden (ไม่งั้นถือว่าล้มเหลว)",
-            ]
-
-        # Optional absolute safety checks (even without baseline)
-        # If error_rate is extremely high or transparency extremely low, flag.
-        err_cur = _num(cur.get("error_rate"))
-        if err_cur is not None and err_cur >= 0.20:
-            hits.append(
-                FalsifierHit(
-                    code="error_rate_extreme",
-                    title="Error rate extremely high (unsafe to scale)",
-                    severity="HIGH",
-                    evidence={"error_rate": err_cur},
-                    recommendation="Do not scale. Add validation, training, and staged gates immediately.",
-                )
-            )
-            actions.append("ห้าม scale; เพิ่ม validation/training และทำ staged rollout")
-
-        # Decide verdict
-        high_hits = [h for h in hits if h.severity == "HIGH"]
-        verdict = "FALSIFIED" if len(high_hits) > 0 else "OK"
 
-        if verdict == "FALSIFIED":
-            summary = f"FALSIFIED — {len(high_hits)} high-severity falsifiers triggered. Rollout should be paused/rolled back."
+        # Table-driven decode: map each set bit to its code and assemble the
+        # evidence dict from the flat (key, source, slot) spec.
+        thr = self._thr
+        for bit, code, ev_spec in _RULE_TABLE:
+            if flags & bit:
+                evidence: Dict[str, Any] = {}
+                for key, src, slot in ev_spec:
+                    if src == _EV_PCT:
+                        evidence[key] = pct[slot]
+                    elif src == _EV_CUR:
+                        evidence[key] = cur_vec[slot]
+                    else:
+                        evidence[key] = thr[slot]
+                hits.append(_make_hit(code, evidence))
+                actions += _HIT_ACTIONS[code]
+
+        # Decide verdict; counting avoids materializing the high-severity list
+        high_count = sum(1 for h in hits if h.severity == "HIGH")
+        if high_count:
+            verdict = "FALSIFIED"
+            summary = f"FALSIFIED — {high_count} high-severity falsifiers triggered. Rollout should be paused/rolled back."
         else:
-            summary = f"OK — No high-severity falsifiers triggered. Continue staged monitoring."
+            verdict = "OK"
+            summary = _OK_SUMMARY
 
-        # De-dup actions
-        dedup_actions: List[str] = []
-        for a in actions:
-            if a not in dedup_actions:
-                dedup_actions.append(a)
+        # De-dup actions, preserving first-seen order
+        dedup_actions = list(dict.fromkeys(actions))
 
         return FalsifierResult(
-            timestamp_utc=_now_utc_iso(),
+            timestamp_utc=ts,
             verdict=verdict,
             hits=hits,
             summary=summary,
             recommended_actions=dedup_actions[:10],
-            metadata={
-                "window": snap.window,
-                "require_baseline": self.require_baseline,
-                "thresholds": self.thresholds,
-                **(snap.metadata or {}),
-            },
+            metadata=self._result_metadata(snap),
         )
+
+    def _result_metadata(self, snap: MetricsSnapshot) -> Dict[str, Any]:
+        md = {
+            "window": snap.window,
+            "require_baseline": self.require_baseline,
+            "thresholds": self.thresholds,
+        }
+        if snap.metadata:
+            md.update(snap.metadata)
+        return md
+
+
+# Shared default-configured engine. Engine construction is cheap but not
+# free (threshold coercion + packing), and hot callers (per-request web
+# handlers, tick loops) have no reason to rebuild it; its bound thresholds
+# also keep the kernel cache warm across calls. Callers needing custom
+# thresholds still construct their own FalsifierEngine.
+DEFAULT_ENGINE = FalsifierEngine(require_baseline=True)
+
+
+def falsify(
+    current: Dict[str, Any],
+    baseline: Optional[Dict[str, Any]] = None,
+    window: str = "unknown",
+) -> FalsifierResult:
+    """One-shot convenience: evaluate a metrics dict against DEFAULT_ENGINE."""
+    return DEFAULT_ENGINE.evaluate(
+        MetricsSnapshot(current=current, baseline=baseline, window=window)
+    )
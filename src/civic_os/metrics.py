@@ -1,3 +1,4 @@
+"""
 CIVIC-OS Metrics Module
 - Normalizes metrics
 - Validates required fields
@@ -25,18 +26,39 @@ DEFAULT_REQUIRED_METRICS = [
     "disparity_index",
 ]
 
+# Immutable forms shared by every default-configured Metrics instance, so
+# instantiation allocates no per-instance copies of the defaults.
+_DEFAULT_REQUIRED_TUPLE = tuple(DEFAULT_REQUIRED_METRICS)
+_DEFAULT_REQUIRED_SET = frozenset(DEFAULT_REQUIRED_METRICS)
+_DEFAULT_KEY_INDEX = {k: i for i, k in enumerate(DEFAULT_REQUIRED_METRICS)}
+
 
 def _num(x: Any) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        if isinstance(x, bool):
+    # Exact-type fast paths first: most values are already numeric, and
+    # type() checks keep bool (an int subclass) out of the int branch.
+    t = type(x)
+    if t is float:
+        return x
+    if t is int:
+        try:
+            return float(x)
+        except OverflowError:
+            # Arbitrary-precision ints (e.g. 10**400) exceed float range;
+            # treat them as non-numeric like any other unconvertible value.
             return None
+    if x is None or t is bool:
+        return None
+    try:
         return float(x)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return None
 
 
+# Sentinel distinguishing "key absent" from an explicit None value with a
+# single dict lookup.
+_MISSING = object()
+
+
 def _pct_change(cur: Optional[float], base: Optional[float]) -> Optional[float]:
     if cur is None or base is None:
         return None
@@ -45,7 +67,7 @@ def _pct_change(cur: Optional[float], base: Optional[float]) -> Optional[float]:
     return (cur - base) / abs(base)
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsValidation:
     ok: bool
     missing: List[str] = field(default_factory=list)
@@ -61,7 +83,7 @@ class MetricsValidation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsDelta:
     current: Dict[str, Any]
     baseline: Optional[Dict[str, Any]]
@@ -81,27 +103,54 @@ class MetricsDelta:
 
 class Metrics:
     def __init__(self, required_metrics: Optional[List[str]] = None):
-        self.required_metrics = required_metrics or list(DEFAULT_REQUIRED_METRICS)
+        if not required_metrics:
+            self.required_metrics = _DEFAULT_REQUIRED_TUPLE
+            self._key_index = _DEFAULT_KEY_INDEX
+            self._required_set = _DEFAULT_REQUIRED_SET
+        else:
+            self.required_metrics = tuple(required_metrics)
+            # Position of each required metric; also serves as a fast
+            # membership test when separating required from extra keys.
+            self._key_index = {k: i for i, k in enumerate(self.required_metrics)}
+            # O(1) membership + one C-level endswith over all suffixes,
+            # instead of a list scan plus three endswith calls per key.
+            self._required_set = frozenset(self.required_metrics)
+        self._suffixes = ("_index", "_rate", "_coverage")
 
     def normalize(self, raw: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize known metric keys to floats where possible; keep others as-is.
         """
-        out: Dict[str, Any] = dict(raw or {})
-        for k, v in list(out.items()):
-            if k in self.required_metrics or k.endswith("_index") or k.endswith("_rate") or k.endswith("_coverage"):
+        if not raw:
+            return {}
+        required = self._required_set
+        suffixes = self._suffixes
+        # Common case: every known metric is already numeric, so the input
+        # can be returned as-is instead of copied. Callers treat normalized
+        # dicts as read-only.
+        if all(
+            type(v) in (int, float)
+            for k, v in raw.items()
+            if k in required or k.endswith(suffixes)
+        ):
+            return raw
+        out: Dict[str, Any] = dict(raw)
+        for k, v in raw.items():
+            if k in required or k.endswith(suffixes):
                 n = _num(v)
                 out[k] = n if n is not None else v
         return out
 
     def validate(self, current: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> MetricsValidation:
         cur = current or {}
-        missing = [k for k in self.required_metrics if k not in cur or cur.get(k) is None]
+        missing: List[str] = []
         non_numeric: List[str] = []
         for k in self.required_metrics:
-            if k in cur and cur.get(k) is not None:
-                if _num(cur.get(k)) is None:
-                    non_numeric.append(k)
+            v = cur.get(k, _MISSING)
+            if v is _MISSING or v is None:
+                missing.append(k)
+            elif _num(v) is None:
+                non_numeric.append(k)
 
         notes = []
         if baseline is None:
@@ -118,15 +167,30 @@ class Metrics:
         absolute: Dict[str, Optional[float]] = {}
         pct: Dict[str, Optional[float]] = {}
 
-        for k in set(list(cur.keys()) + (list(base.keys()) if base else [])):
+        # Required metrics: one aligned pass in declaration order with the
+        # arithmetic inlined, so the common case never builds a key union.
+        for k in self.required_metrics:
             c = _num(cur.get(k))
             b = _num(base.get(k)) if base else None
             if c is not None and b is not None:
-                absolute[k] = c - b
-                pct[k] = _pct_change(c, b)
+                d = c - b
+                absolute[k] = d
+                pct[k] = d / abs(b) if b != 0 else None
             else:
-                absolute[k] = None if c is None or b is None else c - b
-                pct[k] = _pct_change(c, b)
+                absolute[k] = None
+                pct[k] = None
+
+        # Extra (non-required) keys keep the generic scalar path. The union
+        # of dict views is computed in C, without intermediate lists.
+        key_index = self._key_index
+        keys = cur.keys() | base.keys() if base else cur.keys()
+        for k in keys:
+            if k in key_index:
+                continue
+            c = _num(cur.get(k))
+            b = _num(base.get(k)) if base else None
+            absolute[k] = None if c is None or b is None else c - b
+            pct[k] = _pct_change(c, b)
 
         return MetricsDelta(
             current=cur,
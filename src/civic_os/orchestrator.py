@@ -1,3 +1,4 @@
+"""
 CIVIC-OS Orchestrator (Executable Scaffold)
 - Runs a CIVIC-OS cycle with:
   - AuditGate (Truth/Logic/Risk/Bias/Clarity)
@@ -16,8 +17,8 @@ Usage (minimal demo):
 
 from __future__ import annotations
 
+import copy
 import os
-import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -27,7 +28,126 @@ from civic_os.falsifier_engine import FalsifierEngine, MetricsSnapshot
 from civic_os.signed_memory import SignedMemory, SignedEntry
 
 
-@dataclass
+# Default artifact templates, built once at import time. _ensure_minimum_artifacts
+# deep-copies only the branches a caller did not pre-fill, instead of
+# reconstructing every nested literal on each run. IC carries a placeholder
+# Goal that is overwritten with the actual task.
+
+_IC_DEFAULT = {
+    "Goal": "",
+    "Deliverable": "A staged reform/service redesign plan with measurable outcomes",
+    "Constraints": ["Legality", "Due process", "Auditability", "Rollback-by-default"],
+    "Success metrics": [
+        "service_latency_median",
+        "service_latency_p90",
+        "error_rate",
+        "transparency_coverage",
+        "citizen_burden_index",
+        "disparity_index",
+    ],
+    "Citizen summary": (
+        "This change aims to reduce time and burden for citizens while keeping decisions fair and traceable. "
+        "We will roll out in stages (pilot → limited rollout → scale) and publish outcome metrics. "
+        "If errors, appeals, or inequality worsen, we pause and roll back."
+    ),
+}
+
+_ES_DEFAULT = {
+    "Facts": ["Baseline metrics exist or will be collected in pilot."],
+    "Assumptions": ["Digitization reduces burden if steps are removed, not replicated."],
+    "Unknowns": ["Frontline workload shift risk", "Disparity changes by region"],
+    "Sources": [],
+    "Data risks": ["Sampling bias", "Gaming KPIs"],
+}
+
+_FPF_DEFAULT = {
+    "Axioms": [
+        "Incentives shape behavior more than slogans.",
+        "What is not measured becomes theatre.",
+    ],
+    "Invariants": ["Time/attention finite", "Trust fragile"],
+    "Variables": ["queue_size", "review_capacity", "validation_rules", "appeal_load"],
+    "Levers": ["staged_rollout", "midpoint_validation", "simplify_steps", "trace_logging"],
+    "Falsifiers": [
+        "Latency down but errors/appeals up",
+        "Throughput up but disparity up",
+        "Citizen burden increases after 'digital'",
+    ],
+    "Minimal tests": [
+        "Pilot in 1-2 districts, measure p90 latency + error_rate",
+        "A/B test simplified steps vs existing",
+        "Equity monitoring by region/group",
+    ],
+}
+
+_WM_DEFAULT = {
+    "Causal structure": "Queue + capacity + validation quality determine latency and error rate.",
+    "Loops": ["Rework loop: errors increase rework which increases latency"],
+    "Delays": ["Policy changes reflect in metrics with 2-4 week lag"],
+    "Bottlenecks": ["Review step"],
+    "Constraints": ["Legal due process", "Staff capacity"],
+}
+
+_SM_DEFAULT = {
+    "Boundary": "Service delivery workflow and approvals",
+    "Actors & incentives": [
+        "Citizens: want fast + fair",
+        "Frontline staff: workload + risk avoidance",
+        "Managers: KPI + reputation",
+    ],
+    "Hidden costs/externalities": ["Shadow paperwork", "Increased appeals load"],
+    "Feedback loops/delays": ["Errors → appeals → delays → public trust drop"],
+    "Corruption surfaces": ["Discretion points without logs"],
+    "Capacity constraints": ["Review staff count", "IT throughput"],
+}
+
+_DS_DEFAULT = {
+    "Option A": {
+        "name": "Safe",
+        "description": "Pilot only with strict validation and manual oversight.",
+        "Downside": "Slower improvement",
+        "Triggers/Kill-switch": "If error_rate +10% or disparity +5% => pause/rollback",
+    },
+    "Option B": {
+        "name": "Balanced",
+        "description": "Pilot + limited rollout with automated checks and public dashboards.",
+        "Downside": "Moderate risk",
+        "Triggers/Kill-switch": "If p90 latency not improved within 4 weeks => revise levers",
+    },
+    "Option C": {
+        "name": "Aggressive",
+        "description": "Fast scale with automation; only if audit gates pass strongly.",
+        "Downside": "High risk of hidden failures",
+        "Triggers/Kill-switch": "Any audit FAIL or falsifier HIGH => freeze immediately",
+    },
+    "Global downside bound": "No scaling if any HIGH falsifier triggers; rollback to last stable stage.",
+    "Rollback plan": "Revert to prior workflow + keep logs; rerun pilot with revised constraints.",
+    "Kill-switch": "Immediate freeze of rollout; route new cases to safe path.",
+}
+
+_AP_DEFAULT = {
+    "Stages": ["Pilot", "Limited rollout", "Scale"],
+    "Instrumentation": "Collect latency/error/appeal/burden/disparity + trace logs per step.",
+    "Metrics & thresholds": {
+        "error_rate": "must not increase >10%",
+        "disparity_index": "must not increase >5%",
+        "transparency_coverage": "must be >= 0.60",
+    },
+    "Rollback": "If thresholds breached, revert to previous stage and publish incident note.",
+    "Kill-switch": "Freeze scaling; revert routing to pilot-safe workflow.",
+    "Execution checklist": [
+        "Define baseline metrics (median/p90 latency, error_rate, burden, disparity)",
+        "Enable trace logging for all decision points",
+        "Run weekly audit review meeting (Verifier can veto)",
+    ],
+    "Citizen summary": (
+        "We are improving the service in stages. We will publish metrics and keep decisions traceable. "
+        "If quality, fairness, or burden worsens, we stop and roll back."
+    ),
+}
+
+
+@dataclass(slots=True)
 class RunInput:
     task: str
     artifacts: Dict[str, Any] = field(default_factory=dict)  # optional prefilled artifacts
@@ -37,7 +157,7 @@ class RunInput:
     domain: str = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class RunResult:
     run_id: str
     audit_overall: str                 # PASS/FAIL
@@ -71,237 +191,137 @@ class CivicOSOrchestrator:
 
         mem = SignedMemory(run_dir=str(run_dir))
 
-        # Stage 0: seed minimal IC if missing
-        artifacts = dict(inp.artifacts or {})
-        artifacts = self._ensure_minimum_artifacts(task=inp.task, artifacts=artifacts)
+        try:
+            # Stage 0: seed minimal IC if missing
+            artifacts = dict(inp.artifacts or {})
+            artifacts = self._ensure_minimum_artifacts(task=inp.task, artifacts=artifacts)
 
-        # Log run start
-        mem.append(
-            SignedEntry(
-                run_id=run_id,
-                seq=0,
-                event="RUN_START",
-                payload={
-                    "codex_id": self.CODEX_ID,
-                    "task": inp.task,
-                    "domain": inp.domain,
-                    "window": inp.window,
-                    "strict_audit": self.audit_gate.strict,
-                    "require_baseline_for_falsifiers": self.falsifier_engine.require_baseline,
-                },
+            # Log run start
+            mem.append(
+                SignedEntry(
+                    run_id=run_id,
+                    seq=0,
+                    event="RUN_START",
+                    payload={
+                        "codex_id": self.CODEX_ID,
+                        "task": inp.task,
+                        "domain": inp.domain,
+                        "window": inp.window,
+                        "strict_audit": self.audit_gate.strict,
+                        "require_baseline_for_falsifiers": self.falsifier_engine.require_baseline,
+                    },
+                )
             )
-        )
 
-        # Stage 7: Audit Gate
-        audit_ctx = AuditContext(artifacts=artifacts, metadata={"domain": inp.domain})
-        audit_report = self.audit_gate.evaluate(audit_ctx).to_dict()
+            # Stage 7: Audit Gate
+            audit_ctx = AuditContext(artifacts=artifacts, metadata={"domain": inp.domain})
+            audit = self.audit_gate.evaluate(audit_ctx)
+            audit_report = audit.to_dict()
 
-        mem.append(
-            SignedEntry(
-                run_id=run_id,
-                seq=0,
-                event="AUDIT_REPORT",
-                payload=audit_report,
-            )
-        )
-
-        # Falsifier evaluation (optional)
-        falsifier_result = None
-        falsifier_verdict = "OK"
-        if inp.metrics_current is not None:
-            snap = MetricsSnapshot(
-                current=inp.metrics_current,
-                baseline=inp.metrics_baseline,
-                window=inp.window,
-                metadata={"domain": inp.domain},
+            mem.append(
+                SignedEntry(
+                    run_id=run_id,
+                    seq=0,
+                    event="AUDIT_REPORT",
+                    payload=audit_report,
+                ),
+                payload_bytes=audit.to_canonical_bytes(),
             )
-            falsifier_result = self.falsifier_engine.evaluate(snap).to_dict()
-            falsifier_verdict = falsifier_result["verdict"]
+
+            # Falsifier evaluation (optional)
+            falsifier_result = None
+            falsifier_verdict = "OK"
+            if inp.metrics_current is not None:
+                snap = MetricsSnapshot(
+                    current=inp.metrics_current,
+                    baseline=inp.metrics_baseline,
+                    window=inp.window,
+                    metadata={"domain": inp.domain},
+                )
+                falsifier = self.falsifier_engine.evaluate(snap)
+                falsifier_result = falsifier.to_dict()
+                falsifier_verdict = falsifier_result["verdict"]
+
+                mem.append(
+                    SignedEntry(
+                        run_id=run_id,
+                        seq=0,
+                        event="FALSIFIER_RESULT",
+                        payload=falsifier_result,
+                    ),
+                    payload_bytes=falsifier.to_canonical_bytes(),
+                )
+
+            # Decide final run status
+            audit_overall = audit_report["overall_verdict"]
+            final_status = "PASS"
+            if audit_overall == "FAIL":
+                final_status = "BLOCKED_BY_AUDIT"
+            elif falsifier_verdict == "FALSIFIED":
+                final_status = "FALSIFIED_IN_MONITORING"
 
             mem.append(
                 SignedEntry(
                     run_id=run_id,
                     seq=0,
-                    event="FALSIFIER_RESULT",
-                    payload=falsifier_result,
+                    event="RUN_END",
+                    payload={
+                        "final_status": final_status,
+                        "audit_overall": audit_overall,
+                        "falsifier_verdict": falsifier_verdict,
+                        "notes": "Staged rollout only. If audit FAIL or falsified => freeze/rollback + model upgrade.",
+                    },
                 )
             )
 
-        # Decide final run status
-        audit_overall = audit_report["overall_verdict"]
-        final_status = "PASS"
-        if audit_overall == "FAIL":
-            final_status = "BLOCKED_BY_AUDIT"
-        elif falsifier_verdict == "FALSIFIED":
-            final_status = "FALSIFIED_IN_MONITORING"
+            outputs = {
+                "artifacts": artifacts,
+                "audit_report": audit_report,
+                "falsifier_result": falsifier_result,
+                "final_status": final_status,
+                "signed_log_path": str(run_dir / "signed_log.jsonl"),
+            }
 
-        mem.append(
-            SignedEntry(
+            return RunResult(
                 run_id=run_id,
-                seq=0,
-                event="RUN_END",
-                payload={
-                    "final_status": final_status,
-                    "audit_overall": audit_overall,
-                    "falsifier_verdict": falsifier_verdict,
-                    "notes": "Staged rollout only. If audit FAIL or falsified => freeze/rollback + model upgrade.",
-                },
+                audit_overall=audit_overall,
+                falsifier_verdict=falsifier_verdict,
+                outputs=outputs,
+                run_dir=str(run_dir),
             )
-        )
-
-        outputs = {
-            "artifacts": artifacts,
-            "audit_report": audit_report,
-            "falsifier_result": falsifier_result,
-            "final_status": final_status,
-            "signed_log_path": str(run_dir / "signed_log.jsonl"),
-        }
-
-        return RunResult(
-            run_id=run_id,
-            audit_overall=audit_overall,
-            falsifier_verdict=falsifier_verdict,
-            outputs=outputs,
-            run_dir=str(run_dir),
-        )
+        finally:
+            mem.close()
 
     # -------------------------
     # Helpers
     # -------------------------
     def _new_run_id(self) -> str:
-        # short but unique enough for local runs
-        return f"{uuid.uuid4().hex[:12]}"
+        # short but unique enough for local runs; one 6-byte urandom read
+        # gives the same 12 hex chars without UUID construction overhead
+        return os.urandom(6).hex()
 
     def _ensure_minimum_artifacts(self, task: str, artifacts: Dict[str, Any]) -> Dict[str, Any]:
         """
         Ensures the minimum artifacts exist so AuditGate can operate.
         You can replace this with LLM-generated stages later.
         """
-        # IC
+        # IC depends on the task; the rest are verbatim deep copies of the
+        # module-level templates.
         if "IC" not in artifacts:
-            artifacts["IC"] = {
-                "Goal": task,
-                "Deliverable": "A staged reform/service redesign plan with measurable outcomes",
-                "Constraints": ["Legality", "Due process", "Auditability", "Rollback-by-default"],
-                "Success metrics": [
-                    "service_latency_median",
-                    "service_latency_p90",
-                    "error_rate",
-                    "transparency_coverage",
-                    "citizen_burden_index",
-                    "disparity_index",
-                ],
-                "Citizen summary": (
-                    "This change aims to reduce time and burden for citizens while keeping decisions fair and traceable. "
-                    "We will roll out in stages (pilot → limited rollout → scale) and publish outcome metrics. "
-                    "If errors, appeals, or inequality worsen, we pause and roll back."
-                ),
-            }
-
-        # ES
+            ic = copy.deepcopy(_IC_DEFAULT)
+            ic["Goal"] = task
+            artifacts["IC"] = ic
         if "ES" not in artifacts:
-            artifacts["ES"] = {
-                "Facts": ["Baseline metrics exist or will be collected in pilot."],
-                "Assumptions": ["Digitization reduces burden if steps are removed, not replicated."],
-                "Unknowns": ["Frontline workload shift risk", "Disparity changes by region"],
-                "Sources": [],
-                "Data risks": ["Sampling bias", "Gaming KPIs"],
-            }
-
-        # FPF
+            artifacts["ES"] = copy.deepcopy(_ES_DEFAULT)
         if "FPF" not in artifacts:
-            artifacts["FPF"] = {
-                "Axioms": [
-                    "Incentives shape behavior more than slogans.",
-                    "What is not measured becomes theatre.",
-                ],
-                "Invariants": ["Time/attention finite", "Trust fragile"],
-                "Variables": ["queue_size", "review_capacity", "validation_rules", "appeal_load"],
-                "Levers": ["staged_rollout", "midpoint_validation", "simplify_steps", "trace_logging"],
-                "Falsifiers": [
-                    "Latency down but errors/appeals up",
-                    "Throughput up but disparity up",
-                    "Citizen burden increases after 'digital'",
-                ],
-                "Minimal tests": [
-                    "Pilot in 1-2 districts, measure p90 latency + error_rate",
-                    "A/B test simplified steps vs existing",
-                    "Equity monitoring by region/group",
-                ],
-            }
-
-        # WM
+            artifacts["FPF"] = copy.deepcopy(_FPF_DEFAULT)
         if "WM" not in artifacts:
-            artifacts["WM"] = {
-                "Causal structure": "Queue + capacity + validation quality determine latency and error rate.",
-                "Loops": ["Rework loop: errors increase rework which increases latency"],
-                "Delays": ["Policy changes reflect in metrics with 2-4 week lag"],
-                "Bottlenecks": ["Review step"],
-                "Constraints": ["Legal due process", "Staff capacity"],
-            }
-
-        # SM
+            artifacts["WM"] = copy.deepcopy(_WM_DEFAULT)
         if "SM" not in artifacts:
-            artifacts["SM"] = {
-                "Boundary": "Service delivery workflow and approvals",
-                "Actors & incentives": [
-                    "Citizens: want fast + fair",
-                    "Frontline staff: workload + risk avoidance",
-                    "Managers: KPI + reputation",
-                ],
-                "Hidden costs/externalities": ["Shadow paperwork", "Increased appeals load"],
-                "Feedback loops/delays": ["Errors → appeals → delays → public trust drop"],
-                "Corruption surfaces": ["Discretion points without logs"],
-                "Capacity constraints": ["Review staff count", "IT throughput"],
-            }
-
-        # DS (3 options)
+            artifacts["SM"] = copy.deepcopy(_SM_DEFAULT)
         if "DS" not in artifacts:
-            artifacts["DS"] = {
-                "Option A": {
-                    "name": "Safe",
-                    "description": "Pilot only with strict validation and manual oversight.",
-                    "Downside": "Slower improvement",
-                    "Triggers/Kill-switch": "If error_rate +10% or disparity +5% => pause/rollback",
-                },
-                "Option B": {
-                    "name": "Balanced",
-                    "description": "Pilot + limited rollout with automated checks and public dashboards.",
-                    "Downside": "Moderate risk",
-                    "Triggers/Kill-switch": "If p90 latency not improved within 4 weeks => revise levers",
-                },
-                "Option C": {
-                    "name": "Aggressive",
-                    "description": "Fast scale with automation; only if audit gates pass strongly.",
-                    "Downside": "High risk of hidden failures",
-                    "Triggers/Kill-switch": "Any audit FAIL or falsifier HIGH => freeze immediately",
-                },
-                "Global downside bound": "No scaling if any HIGH falsifier triggers; rollback to last stable stage.",
-                "Rollback plan": "Revert to prior workflow + keep logs; rerun pilot with revised constraints.",
-                "Kill-switch": "Immediate freeze of rollout; route new cases to safe path.",
-            }
-
-        # AP
+            artifacts["DS"] = copy.deepcopy(_DS_DEFAULT)
         if "AP" not in artifacts:
-            artifacts["AP"] = {
-                "Stages": ["Pilot", "Limited rollout", "Scale"],
-                "Instrumentation": "Collect latency/error/appeal/burden/disparity + trace logs per step.",
-                "Metrics & thresholds": {
-                    "error_rate": "must not increase >10%",
-                    "disparity_index": "must not increase >5%",
-                    "transparency_coverage": "must be >= 0.60",
-                },
-                "Rollback": "If thresholds breached, revert to previous stage and publish incident note.",
-                "Kill-switch": "Freeze scaling; revert routing to pilot-safe workflow.",
-                "Execution checklist": [
-                    "Define baseline metrics (median/p90 latency, error_rate, burden, disparity)",
-                    "Enable trace logging for all decision points",
-                    "Run weekly audit review meeting (Verifier can veto)",
-                ],
-                "Citizen summary": (
-                    "We are improving the service in stages. We will publish metrics and keep decisions traceable. "
-                    "If quality, fairness, or burden worsens, we stop and roll back."
-                ),
-            }
+            artifacts["AP"] = copy.deepcopy(_AP_DEFAULT)
 
         return artifacts
@@ -1,3 +1,4 @@
+"""
 CIVIC-OS Signed Memory (Append-only)
 - Stores decision artifacts + audit results + falsifier results
 - Signs entries to make tampering detectable
@@ -23,30 +24,85 @@ from __future__ import annotations
 import hashlib
 import hmac
 import json
+import mmap
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 def _now_utc_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+    # One time.time_ns() read plus strftime on the integer seconds; skips
+    # the datetime/tzinfo machinery while keeping an ISO-8601 UTC string
+    # (now with nanosecond precision).
+    ns = time.time_ns()
+    s, ns_rem = divmod(ns, 1_000_000_000)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(s)) + f".{ns_rem:09d}+00:00"
+
+
+def _canonical_json_bytes(obj: Any) -> bytes:
+    """Canonical form (sorted keys, tight separators) as UTF-8 bytes."""
+    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
 
 
-def _canonical_json(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+def _sha256_hex(b: bytes) -> str:
+    # Bytes in, no re-encoding: lets hashlib's OpenSSL backend process the
+    # buffer directly.
+    return hashlib.sha256(b).hexdigest()
 
 
-def _sha256_hex(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()
+def _blake2b_hex(b: bytes) -> str:
+    # Chain hash. BLAKE2b-256 is notably faster than SHA-256 in software
+    # while staying in the stdlib and keeping the same 64-hex-char digest
+    # width; tamper evidence only needs collision resistance. Signatures
+    # remain HMAC-SHA256 for external interop.
+    return hashlib.blake2b(b, digest_size=32).hexdigest()
 
 
-def _hmac_sha256_hex(secret: bytes, msg: str) -> str:
-    return hmac.new(secret, msg.encode("utf-8"), hashlib.sha256).hexdigest()
+# The hash is defined over the canonical entry with hash and signature set to
+# this fixed-width placeholder (64 chars = sha256/HMAC hex length). Writing
+# splices the real values over the placeholders, so each append serializes the
+# entry exactly once; verification rebuilds the same preimage from the parsed
+# line.
+_PLACEHOLDER = "0" * 64
+_HASH_PAT = b'"hash":"' + _PLACEHOLDER.encode("ascii") + b'"'
+_SIG_PAT = b'"signature":"' + _PLACEHOLDER.encode("ascii") + b'"'
 
+# The exact top-level key set of a well-formed entry. _canonical_entry_bytes
+# only emits these keys, so verification must reject any other key set: a
+# foreign key injected into a logged line would otherwise be dropped from the
+# reconstructed preimage and re-hash to the original, unflagged.
+_ENVELOPE_KEYS = frozenset((
+    "event", "hash", "payload", "prev_hash", "run_id", "seq", "signature", "timestamp_utc",
+))
 
-@dataclass
+
+def _canonical_entry_bytes(d: Dict[str, Any], payload_bytes: Optional[bytes] = None) -> bytes:
+    """
+    Canonical bytes for a SignedEntry dict with the envelope keys emitted in
+    their (fixed, known) sorted order, so the generic sort_keys recursion only
+    runs on the free-form payload. hash/prev_hash/signature are hex digests or
+    empty and are embedded verbatim; byte-identical to _canonical_json_bytes
+    for well-formed entries. Callers that already hold the payload in
+    canonical form may pass it as payload_bytes to skip re-serializing it.
+    """
+    dumps = json.dumps
+    return b"".join((
+        b'{"event":', dumps(d.get("event", ""), ensure_ascii=False).encode("utf-8"),
+        b',"hash":"', str(d.get("hash", "")).encode("ascii"),
+        b'","payload":', payload_bytes if payload_bytes is not None else _canonical_json_bytes(d.get("payload", {})),
+        b',"prev_hash":"', str(d.get("prev_hash", "")).encode("ascii"),
+        b'","run_id":', dumps(d.get("run_id", ""), ensure_ascii=False).encode("utf-8"),
+        b',"seq":', str(d.get("seq", 0)).encode("ascii"),
+        b',"signature":"', str(d.get("signature", "")).encode("ascii"),
+        b'","timestamp_utc":', dumps(d.get("timestamp_utc", ""), ensure_ascii=False).encode("utf-8"),
+        b"}",
+    ))
+
+
+@dataclass(slots=True)
 class SignedEntry:
     """
     A signed append-only log entry.
@@ -100,23 +156,63 @@ class SignedMemory:
 
         secret = os.getenv("SIGNING_SECRET", "").encode("utf-8")
         self._secret: Optional[bytes] = secret if secret else None
+        # Keyed HMAC object built once; per-entry signatures copy() it instead
+        # of re-deriving the key schedule on every call.
+        self._hmac_template = hmac.new(secret, b"", hashlib.sha256) if secret else None
 
         self._seq = 0
         self._prev_hash = ""
         self._load_tail()
 
+        # One persistent append-mode handle instead of an open/write/close
+        # cycle per entry. Writes accumulate in a 64 KiB userspace buffer;
+        # close() flushes and fsyncs once, so a run costs one write syscall
+        # plus one durability point instead of one flush per entry.
+        self._fh = self.path.open("ab", buffering=65536)
+
+    def close(self) -> None:
+        """Flushes, fsyncs and closes the underlying log handle."""
+        if not self._fh.closed:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+
+    def __enter__(self) -> "SignedMemory":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # How much of the file tail to read when resuming a chain. One entry is
+    # typically well under this; payloads larger than the block fall back to
+    # a full scan.
+    _TAIL_BLOCK = 64 * 1024
+
     def _load_tail(self) -> None:
         """
         Loads last seq/hash from existing log to continue appending.
+
+        Reads only the final block of the file instead of streaming every
+        line, so startup cost is constant regardless of log length.
         """
         if not self.path.exists():
             return
-        last_line = None
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    last_line = line
-        if not last_line:
+        last_line = b""
+        with self.path.open("rb") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(max(0, size - self._TAIL_BLOCK))
+            block = f.read().rstrip(b"\n")
+            nl = block.rfind(b"\n")
+            last_line = block[nl + 1:] if nl >= 0 else block
+            if nl < 0 and size > self._TAIL_BLOCK:
+                # Last line longer than the tail block: fall back to full scan.
+                f.seek(0)
+                for line in f:
+                    if line.strip():
+                        last_line = line
+        if not last_line.strip():
             return
         try:
             obj = json.loads(last_line)
@@ -127,37 +223,69 @@ class SignedMemory:
             self._seq = 0
             self._prev_hash = ""
 
-    def _compute_hash(self, entry_dict: Dict[str, Any]) -> str:
-        # Hash excludes signature to avoid circular dependency
+    def _hash_preimage(self, entry_dict: Dict[str, Any], payload_bytes: Optional[bytes] = None) -> bytes:
+        # Hash/signature are placeholdered (not just emptied) so the preimage
+        # has the same byte layout as the written line.
         d = dict(entry_dict)
-        d["signature"] = ""
-        return _sha256_hex(_canonical_json(d))
+        d["hash"] = _PLACEHOLDER
+        d["signature"] = _PLACEHOLDER
+        return _canonical_entry_bytes(d, payload_bytes)
 
     def _compute_signature(self, entry_hash: str) -> str:
-        if not self._secret:
+        if self._hmac_template is None:
             return ""
-        return _hmac_sha256_hex(self._secret, entry_hash)
+        h = self._hmac_template.copy()
+        h.update(entry_hash.encode("ascii"))
+        return h.hexdigest()
 
-    def append(self, entry: SignedEntry) -> SignedEntry:
+    def _chain_entry(self, entry: SignedEntry, payload_bytes: Optional[bytes] = None) -> bytes:
         """
-        Appends an entry to the JSONL log with hash chaining + signature.
+        Assigns seq/prev_hash/hash/signature to the entry, advances the chain,
+        and returns the canonical log line (without trailing newline).
         """
         entry.seq = self._seq
         entry.prev_hash = self._prev_hash
 
-        entry_dict = entry.to_dict()
-        entry.hash = self._compute_hash(entry_dict)
+        buf = self._hash_preimage(entry.to_dict(), payload_bytes)
+        entry.hash = _blake2b_hex(buf)
         entry.signature = self._compute_signature(entry.hash)
 
-        # Write canonical line
-        with self.path.open("a", encoding="utf-8") as f:
-            f.write(_canonical_json(entry.to_dict()) + "\n")
+        # Splice the real hash/signature over the placeholders instead of
+        # serializing the entry a second time. The envelope "hash" key sorts
+        # before "payload" (first match) and "signature" after it (last
+        # match), so payload contents can't be confused with either field.
+        i = buf.find(_HASH_PAT) + len(b'"hash":"')
+        buf = buf[:i] + entry.hash.encode("ascii") + buf[i + len(_PLACEHOLDER):]
+        j = buf.rfind(_SIG_PAT) + len(b'"signature":"')
+        buf = buf[:j] + entry.signature.encode("ascii") + buf[j + len(_PLACEHOLDER):]
 
-        # Advance chain
         self._prev_hash = entry.hash
         self._seq += 1
+        return buf
+
+    def append(self, entry: SignedEntry, payload_bytes: Optional[bytes] = None) -> SignedEntry:
+        """
+        Appends an entry to the JSONL log with hash chaining + signature.
+
+        payload_bytes, if given, must be the canonical JSON form of
+        entry.payload (sorted keys, tight separators, UTF-8); it is spliced
+        into the log line so the payload is not serialized a second time.
+        """
+        line = self._chain_entry(entry, payload_bytes)
+        self._fh.write(line + b"\n")
         return entry
 
+    def append_many(self, entries: List[SignedEntry]) -> List[SignedEntry]:
+        """
+        Appends several entries with a single write: hash-chains them all in
+        memory, then flushes one concatenated buffer to the log.
+        """
+        if not entries:
+            return entries
+        buf = b"".join(self._chain_entry(e) + b"\n" for e in entries)
+        self._fh.write(buf)
+        return entries
+
     def verify_chain(self) -> Dict[str, Any]:
         """
         Verifies:
@@ -168,39 +296,178 @@ class SignedMemory:
         if not self.path.exists():
             return {"ok": True, "checked": 0, "notes": ["No log found."]}
 
+        # Make our own buffered writes visible before reading the file back.
+        if not self._fh.closed:
+            self._fh.flush()
+
+        # Memory-map the log and slice at newline offsets: no per-line str
+        # allocation or eager decode, the kernel pages bytes in as needed.
+        with self.path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return self._verify_report([])
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with mm:
+            parts = [self._verify_range(mm, 0, size)]
+        return self._verify_report(parts)
+
+    def verify_chain_parallel(self, workers: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Parallel variant of verify_chain. The expensive per-line work
+        (json.loads, canonicalization, hashing) is independent, so the log is
+        split into byte ranges snapped to line boundaries and verified by a
+        thread pool (hashlib releases the GIL on large buffers); only the
+        cheap cross-range prev_hash linkage is stitched afterwards.
+        """
+        workers = workers or os.cpu_count() or 1
+        if not self.path.exists():
+            return {"ok": True, "checked": 0, "notes": ["No log found."]}
+        if workers <= 1:
+            return self.verify_chain()
+
+        if not self._fh.closed:
+            self._fh.flush()
+
+        with self.path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return self._verify_report([])
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with mm:
+            # Split into roughly equal ranges, snapped forward to the next
+            # newline so no line straddles two ranges.
+            bounds = [0]
+            step = max(1, size // workers)
+            pos = step
+            while pos < size:
+                nl = mm.find(b"\n", pos)
+                if nl < 0:
+                    break
+                bounds.append(nl + 1)
+                pos = nl + 1 + step
+            bounds.append(size)
+            ranges = [(s, e) for s, e in zip(bounds, bounds[1:]) if e > s]
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parts = list(pool.map(lambda r: self._verify_range(mm, r[0], r[1]), ranges))
+        return self._verify_report(parts)
+
+    def _verify_range(self, mm: mmap.mmap, start: int, end: int) -> Tuple[
+        int, int, List[str], Optional[str], Any, Optional[str]
+    ]:
+        """
+        Verifies hashes/signatures/internal chaining for the whole lines in
+        [start, end). Returns (checked, bad, notes, first_prev_hash,
+        first_seq, last_hash); the first/last fields let the caller stitch
+        range boundaries.
+        """
         checked = 0
-        prev_hash = ""
         bad = 0
-        notes = []
-
-        with self.path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
+        notes: List[str] = []
+        first_prev: Optional[str] = None
+        first_seq: Any = None
+        prev_hash: Optional[str] = None
+
+        # Hot loop: bind everything to locals and parse bytes directly
+        # (json.loads accepts bytes, skipping the text-mode decode layer).
+        loads = json.loads
+        canonical = _canonical_entry_bytes
+        blake2b_hex = _blake2b_hex
+        sha256_hex = _sha256_hex
+        sign = self._compute_signature
+        secret = self._secret
+        find = mm.find
+
+        while start < end:
+            nl = find(b"\n", start, end)
+            stop = nl if nl >= 0 else end
+            line = mm[start:stop]
+            line_start = start
+            start = stop + 1
+            if not line.strip():
+                continue
+            checked += 1
+
+            # Tamper evidence must be reported, never raised: a rewritten
+            # field can break json.loads or the canonical re-encoding (e.g.
+            # non-ASCII bytes where a hex digest belongs), so any per-line
+            # failure counts the line as bad instead of aborting the verify.
+            try:
+                obj = loads(line)
+
+                # Entries with missing or extra top-level keys cannot be
+                # checked through the canonical reconstruction (injected keys
+                # would be silently dropped from the preimage), so an exact
+                # envelope key set is itself part of integrity.
+                if obj.keys() != _ENVELOPE_KEYS:
+                    bad += 1
+                    notes.append(f"Unexpected key set at seq={obj.get('seq')}")
+                    if first_prev is None:
+                        first_prev = obj.get("prev_hash", "")
+                        first_seq = obj.get("seq")
+                    prev_hash = obj.get("hash", "")
                     continue
-                checked += 1
-                obj = json.loads(line)
 
-                # Check chain
-                if obj.get("prev_hash", "") != prev_hash:
+                # Check chain (internal to this range; the first entry's link
+                # is checked by the caller against the previous range).
+                p = obj.get("prev_hash", "")
+                if first_prev is None:
+                    first_prev = p
+                    first_seq = obj.get("seq")
+                elif p != prev_hash:
                     bad += 1
                     notes.append(f"Chain mismatch at seq={obj.get('seq')}")
 
-                # Recompute hash
-                recompute = dict(obj)
-                recompute["signature"] = ""
-                expected_hash = _sha256_hex(_canonical_json(recompute))
-                if obj.get("hash") != expected_hash:
-                    bad += 1
-                    notes.append(f"Hash mismatch at seq={obj.get('seq')}")
+                # Rebuild the preimage in place: obj is throwaway here, so no
+                # per-line dict copy is needed.
+                stored_hash = obj.get("hash", "")
+                stored_sig = obj.get("signature", "")
+                obj["hash"] = _PLACEHOLDER
+                obj["signature"] = _PLACEHOLDER
+                preimage = canonical(obj)
+                expected_hash = blake2b_hex(preimage)
+                if stored_hash != expected_hash:
+                    # Logs written before the BLAKE2b switch chain with
+                    # SHA-256; accept either algorithm per line.
+                    legacy_hash = sha256_hex(preimage)
+                    if stored_hash == legacy_hash:
+                        expected_hash = legacy_hash
+                    else:
+                        bad += 1
+                        notes.append(f"Hash mismatch at seq={obj.get('seq')}")
 
                 # Verify signature if enabled
-                if self._secret:
-                    expected_sig = _hmac_sha256_hex(self._secret, expected_hash)
-                    if obj.get("signature") != expected_sig:
+                if secret:
+                    if stored_sig != sign(expected_hash):
                         bad += 1
                         notes.append(f"Signature mismatch at seq={obj.get('seq')}")
 
-                prev_hash = obj.get("hash", "")
+                prev_hash = stored_hash
+            except Exception:
+                bad += 1
+                notes.append(f"Unreadable entry at byte offset {line_start}")
+                # Break the chain so the next entry's prev_hash is also
+                # flagged; the surrounding entries cannot be trusted to link.
+                prev_hash = None
+
+        return (checked, bad, notes, first_prev, first_seq, prev_hash)
+
+    def _verify_report(self, parts: List[Tuple[int, int, List[str], Optional[str], Any, Optional[str]]]) -> Dict[str, Any]:
+        """Aggregates _verify_range results and stitches range boundaries."""
+        checked = sum(p[0] for p in parts)
+        bad = sum(p[1] for p in parts)
+        notes = [n for p in parts for n in p[2]]
+
+        prev_hash = ""
+        for p in parts:
+            if p[0] == 0:
+                continue
+            if p[3] != prev_hash:
+                bad += 1
+                notes.append(f"Chain mismatch at seq={p[4]}")
+            prev_hash = p[5] or ""
 
         return {
             "ok": bad == 0,
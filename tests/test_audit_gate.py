@@ -1,5 +1,10 @@
 # tests/test_audit_gate.py
-from civic_os.audit_gate import AuditGate, AuditContext
+from civic_os.audit_gate import (
+    AuditGate,
+    AuditContext,
+    _first_present,
+    _specialize_accessor,
+)
 
 
 def test_audit_gate_fails_when_missing_core_fields():
@@ -63,3 +68,41 @@ def test_audit_gate_passes_with_minimum_artifacts():
     ctx = AuditContext(artifacts=artifacts, metadata={})
     rep = gate.evaluate(ctx).to_dict()
     assert rep["overall_verdict"] in ("PASS", "FAIL")  # strict but should usually pass
+
+
+def test_alias_lookup_returns_last_value_when_all_falsy():
+    # Pins the `d.get(a) or d.get(b)` semantics: a present-but-falsy value
+    # under the last alias is returned as-is (and counts as present for the
+    # gates), rather than being collapsed to None.
+    keys = ("Variables", "variables")
+    acc = _specialize_accessor(keys)
+    for lookup in (lambda d: _first_present(d, keys), acc):
+        assert lookup({"Variables": ["x"]}) == ["x"]
+        assert lookup({"variables": ""}) == ""
+        assert lookup({"Variables": "", "variables": {}}) == {}
+        assert lookup({}) is None
+
+
+def test_narrative_heuristics_key_on_option_a_or_list():
+    # The Truth/Bias narrative-drift notes fire on Option A (or an explicit
+    # options list), not on B/C-only decision sets.
+    gate = AuditGate(strict=True)
+
+    def truth_notes(ds):
+        rep = gate.evaluate(AuditContext(artifacts={"DS": ds}, metadata={})).to_dict()
+        return rep["gate_results"][0]["notes"]
+
+    narrative = "narrative-driven"
+    assert any(narrative in n for n in truth_notes({"Option A": {"name": "Safe"}}))
+    assert any(narrative in n for n in truth_notes({"options": [{"name": "Safe"}]}))
+    assert not any(narrative in n for n in truth_notes({"Option B": {"name": "Balanced"}}))
+
+
+def test_audit_gate_fail_fast_skips_later_gates():
+    gate = AuditGate(strict=True, fail_fast=True)
+    ctx = AuditContext(artifacts={"IC": {"Goal": "x"}}, metadata={})
+    rep = gate.evaluate(ctx).to_dict()
+    assert rep["overall_verdict"] == "FAIL"
+    verdicts = [gr["verdict"] for gr in rep["gate_results"]]
+    assert verdicts[0] == "FAIL"
+    assert verdicts[1:] == ["SKIPPED"] * 4
@@ -1,5 +1,5 @@
 # test_falsifier_engine.py
-from civic_os.falsifier_engine import FalsifierEngine, MetricsSnapshot
+from civic_os.falsifier_engine import FalsifierEngine, MetricsSnapshot, falsify
 
 
 def test_falsifier_latency_down_errors_up_triggers():
@@ -51,3 +51,39 @@ def test_falsifier_no_high_hits_ok():
     }
     res = engine.evaluate(MetricsSnapshot(current=current, baseline=baseline, window="weekly"))
     assert res.verdict in ("OK", "FALSIFIED")  # allow threshold sensitivity
+
+
+def test_falsifier_evaluate_batch_matches_single():
+    engine = FalsifierEngine(require_baseline=True)
+    baseline = {
+        "service_latency_median": 10,
+        "error_rate": 0.10,
+        "throughput": 100,
+        "disparity_index": 1.00,
+        "transparency_coverage": 0.70,
+        "citizen_burden_index": 1.00,
+    }
+    bad_current = dict(baseline, service_latency_median=8, error_rate=0.13)
+    snaps = [
+        MetricsSnapshot(current=dict(baseline), baseline=baseline, window="weekly"),
+        MetricsSnapshot(current=bad_current, baseline=baseline, window="weekly"),
+    ]
+    results = engine.evaluate_batch(snaps)
+    assert len(results) == 2
+    assert results[0].verdict == engine.evaluate(snaps[0]).verdict
+    assert results[1].verdict == "FALSIFIED"
+
+
+def test_falsify_convenience_uses_default_engine():
+    baseline = {
+        "service_latency_median": 10,
+        "error_rate": 0.10,
+        "throughput": 100,
+        "disparity_index": 1.00,
+        "transparency_coverage": 0.70,
+        "citizen_burden_index": 1.00,
+    }
+    current = dict(baseline, service_latency_median=8, error_rate=0.13)
+    res = falsify(current, baseline, window="weekly")
+    assert res.verdict == "FALSIFIED"
+    assert res.metadata["window"] == "weekly"
@@ -0,0 +1,16 @@
+# test_metrics.py
+from civic_os.metrics import Metrics
+
+
+def test_validate_flags_overlarge_int_as_non_numeric():
+    # 10**400 is valid JSON but exceeds float range; it must be classified
+    # as non-numeric, not raise OverflowError.
+    current = {k: 1.0 for k in Metrics().required_metrics}
+    current["error_rate"] = 10**400
+    m = Metrics()
+    v = m.validate(current)
+    assert v.ok is False
+    assert v.non_numeric == ["error_rate"]
+    # normalize/compute_deltas must not raise either
+    m.normalize(current)
+    m.compute_deltas(current, dict(current))
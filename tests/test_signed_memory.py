@@ -0,0 +1,71 @@
+# test_signed_memory.py
+from civic_os.signed_memory import SignedEntry, SignedMemory
+
+
+def test_signed_memory_append_verify_roundtrip(tmp_path):
+    mem = SignedMemory(run_dir=str(tmp_path))
+    mem.append(SignedEntry(run_id="t1", seq=0, event="RUN_START", payload={"task": "demo"}))
+    mem.append(SignedEntry(run_id="t1", seq=0, event="RUN_END", payload={"ok": True}))
+    mem.close()
+
+    report = SignedMemory(run_dir=str(tmp_path)).verify_chain()
+    assert report["ok"] is True
+    assert report["checked"] == 2
+
+
+def test_signed_memory_detects_tampering(tmp_path):
+    mem = SignedMemory(run_dir=str(tmp_path))
+    mem.append(SignedEntry(run_id="t2", seq=0, event="RUN_START", payload={"n": 1}))
+    mem.close()
+
+    data = mem.path.read_text(encoding="utf-8")
+    mem.path.write_text(data.replace('"n":1', '"n":2'), encoding="utf-8")
+
+    report = SignedMemory(run_dir=str(tmp_path)).verify_chain()
+    assert report["ok"] is False
+
+
+def test_signed_memory_detects_injected_keys(tmp_path):
+    mem = SignedMemory(run_dir=str(tmp_path))
+    mem.append(SignedEntry(run_id="t5", seq=0, event="RUN_START", payload={"n": 1}))
+    mem.close()
+
+    # A foreign top-level key is not part of the canonical envelope, so the
+    # reconstructed preimage would re-hash unchanged; the verifier must
+    # reject the non-envelope key set instead.
+    data = mem.path.read_text(encoding="utf-8").rstrip("\n")
+    assert data.endswith("}")
+    mem.path.write_text(data[:-1] + ',"zzz_injected":"malicious"}\n', encoding="utf-8")
+
+    report = SignedMemory(run_dir=str(tmp_path)).verify_chain()
+    assert report["ok"] is False
+    assert report["bad"] >= 1
+
+
+def test_signed_memory_reports_unreadable_lines(tmp_path):
+    mem = SignedMemory(run_dir=str(tmp_path))
+    entry = mem.append(SignedEntry(run_id="t4", seq=0, event="RUN_START", payload={"n": 1}))
+    mem.close()
+
+    # Rewriting prev_hash to non-ASCII text (or appending garbage) must be
+    # reported as corruption, not raise from verify_chain.
+    data = mem.path.read_text(encoding="utf-8")
+    data = data.replace(f'"prev_hash":"{entry.prev_hash}"', '"prev_hash":"ไทย"')
+    mem.path.write_text(data + "not json\n", encoding="utf-8")
+
+    report = SignedMemory(run_dir=str(tmp_path)).verify_chain()
+    assert report["ok"] is False
+    assert report["checked"] == 2
+
+
+def test_signed_memory_parallel_verify_matches_sequential(tmp_path):
+    with SignedMemory(run_dir=str(tmp_path)) as mem:
+        for i in range(20):
+            mem.append(SignedEntry(run_id="t3", seq=0, event="E", payload={"i": i}))
+
+    mem = SignedMemory(run_dir=str(tmp_path))
+    seq_report = mem.verify_chain()
+    par_report = mem.verify_chain_parallel(workers=4)
+    assert par_report["ok"] is True
+    assert par_report["checked"] == seq_report["checked"] == 20
+    assert par_report["bad"] == seq_report["bad"] == 0